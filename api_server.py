@@ -3,6 +3,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import List, Optional
 import json
+import os
 
 app = FastAPI(
     title="Local API Server",
@@ -150,14 +151,15 @@ def health_check():
     """서버가 정상 작동 중인지 확인합니다."""
     return {
         "status": "healthy",
+        "pid": os.getpid(),  # 무중단 배포 시 새 인스턴스 식별용
         "users_count": len(users_db),
         "tasks_count": len(tasks_db)
     }
 
 if __name__ == "__main__":
-    import uvicorn
+    from server_runner import run_server
     # http://localhost:8000 에서 실행
     # API 문서: http://localhost:8000/docs (Swagger UI)
     # 대체 문서: http://localhost:8000/redoc (ReDoc)
-    port = 8000
-    uvicorn.run(app, host="127.0.0.1", port=port)
+    port = int(os.getenv("API_PORT", 8000))
+    run_server(app, host="127.0.0.1", port=port)
@@ -2,9 +2,15 @@
 FastAPI 메인 애플리케이션
 모듈화된 구조로 재구성
 """
+import os
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from routers import users, tasks, system, news
+from middleware.admission import AdmissionControlMiddleware
+from middleware.compression import CompressionMiddleware
+from middleware.metrics import MetricsMiddleware
+from middleware.profiling import SlowRequestMiddleware, instrument_routes
+from services.profiler import slow_request_capture
+from services.snapshot import restore_from_snapshot, snapshot_scheduler
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -13,6 +19,10 @@ app = FastAPI(
     version="2.0.0"
 )
 
+# 비용이 큰 라우트 동시 실행 제한 / 클라이언트별 속도 제한 (ADMISSION_LIMITS, RATE_LIMIT_RPS)
+# 나중에 등록한 미들웨어가 바깥쪽이므로, 거절 응답에도 CORS 헤더와 메트릭이 적용되도록 가장 먼저 등록합니다.
+app.add_middleware(AdmissionControlMiddleware)
+
 # CORS 설정 (로컬 웹 UI 접근 허용)
 app.add_middleware(
     CORSMiddleware,
@@ -22,19 +32,52 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 라우트별 지연 시간 / 처리 중 요청 수 수집 (/metrics 에서 조회)
+app.add_middleware(MetricsMiddleware)
+
+# gzip / brotli 응답 압축 (COMPRESS_MIN_BYTES 이상, 압축본은 콘텐츠 버전/해시별로 캐시)
+app.add_middleware(CompressionMiddleware)
+
+# 느린 요청 자동 프로파일링 (SLOW_REQUEST_THRESHOLD_MS 설정 시에만 등록)
+if slow_request_capture is not None:
+    app.add_middleware(SlowRequestMiddleware, capture=slow_request_capture)
+
 # 라우터 등록
-app.include_router(users.router)
-app.include_router(tasks.router)
-app.include_router(system.router)
-app.include_router(news.router)
+# ENABLED_ROUTERS 로 필요한 라우터만 로드 (예: "users,tasks,system")
+# 지정하지 않은 라우터 모듈은 import 자체를 하지 않으므로 시작 시간이 줄어듭니다.
+ENABLED_ROUTERS = [
+    name.strip()
+    for name in os.getenv("ENABLED_ROUTERS", "users,tasks,system,news,search,admin").split(",")
+    if name.strip()
+]
+
+for router_name in ENABLED_ROUTERS:
+    # importlib.import_module 은 -X importtime 에 집계되지 않으므로 __import__ 사용
+    app.include_router(__import__(f"routers.{router_name}", fromlist=["router"]).router)
+
+# 느린 요청 프로파일에 해당 요청을 처리한 워커 스레드의 스택만 담기도록 동기 엔드포인트를 감쌈
+if slow_request_capture is not None:
+    instrument_routes(app)
+
+
+# 저장소 스냅샷: 시작 시 복원, 주기적으로 저장, 종료(SIGTERM) 시 저장
+@app.on_event("startup")
+def load_snapshot() -> None:
+    restore_from_snapshot()
+    snapshot_scheduler.start()
+
+
+@app.on_event("shutdown")
+def save_snapshot() -> None:
+    snapshot_scheduler.stop()
 
 
 if __name__ == "__main__":
-    import uvicorn
+    from server_runner import run_server
     # http://localhost:8000 에서 실행
     # API 문서: http://localhost:8000/docs (Swagger UI)
     # 대체 문서: http://localhost:8000/redoc (ReDoc)
-    port = 8000
+    port = int(os.getenv("API_PORT", 8000))
     print(f"🚀 서버 시작: http://127.0.0.1:{port}")
     print(f"📚 API 문서: http://127.0.0.1:{port}/docs")
-    uvicorn.run(app, host="127.0.0.1", port=port)
+    run_server(app, host="127.0.0.1", port=port)
@@ -1,8 +1,9 @@
 """
 인메모리 데이터베이스
 """
-from typing import List
-from models import User, Task
+import threading
+from typing import Dict, List, Optional
+from models import User, Task, NewsArticle
 
 
 # 사용자 데이터베이스
@@ -16,3 +17,90 @@ tasks_db: List[Task] = [
     Task(id=1, title="학습", description="FastAPI 배우기", completed=False, user_id=1),
     Task(id=2, title="프로젝트", description="API 서버 구축", completed=True, user_id=1),
 ]
+
+# 마지막으로 수집한 뉴스 기사
+news_db: List[NewsArticle] = []
+
+# 여러 행을 한 번에 바꾸는 작업(일괄 변경, 연쇄 삭제)을 다른 쓰기와 섞이지 않게 하는 락
+write_lock = threading.RLock()
+
+# 컬렉션 / 행 단위 버전 카운터 (ETag 생성용)
+_version_lock = threading.Lock()
+collection_versions: Dict[str, int] = {"users": 1, "tasks": 1, "news": 1}
+row_versions: Dict[str, Dict[int, int]] = {
+    "users": {u.id: 1 for u in users_db},
+    "tasks": {t.id: 1 for t in tasks_db},
+    "news": {},
+}
+
+
+def bump_version(collection: str, row_id: Optional[int] = None, deleted: bool = False) -> None:
+    """
+    컬렉션 버전을 올리고, row_id가 주어지면 해당 행에 새 컬렉션 버전을 기록합니다.
+    (삭제 후 같은 ID로 재생성되어도 ETag가 겹치지 않도록 단조 증가 값을 사용)
+    삭제된 행은 행 버전 테이블에서 제거합니다.
+    """
+    with _version_lock:
+        collection_versions[collection] += 1
+        if row_id is None:
+            return
+        rows = row_versions[collection]
+        if deleted:
+            rows.pop(row_id, None)
+        else:
+            rows[row_id] = collection_versions[collection]
+
+
+def bump_versions(collection: str, row_ids: List[int], deleted: bool = False) -> None:
+    """
+    여러 행을 한 번에 바꾼 뒤 컬렉션 버전을 한 번만 올리고, 바뀐 행 모두에 새 버전을 기록합니다.
+    (캐시와 ETag가 중간 상태 없이 한 번에 바뀜)
+    """
+    with _version_lock:
+        collection_versions[collection] += 1
+        rows = row_versions[collection]
+        for row_id in row_ids:
+            if deleted:
+                rows.pop(row_id, None)
+            else:
+                rows[row_id] = collection_versions[collection]
+
+
+def get_collection_version(collection: str) -> int:
+    """컬렉션 전체의 현재 버전을 반환합니다."""
+    return collection_versions[collection]
+
+
+def get_row_version(collection: str, row_id: int) -> int:
+    """특정 행의 현재 버전을 반환합니다. (없으면 0)"""
+    return row_versions[collection].get(row_id, 0)
+
+
+def replace_news(articles: List[NewsArticle]) -> None:
+    """마지막으로 수집한 뉴스 목록을 교체합니다."""
+    with write_lock:
+        news_db[:] = articles
+        bump_version("news")
+
+
+def restore(
+    users: List[User],
+    tasks: List[Task],
+    news: List[NewsArticle],
+    versions: Dict[str, int],
+) -> None:
+    """
+    스냅샷에서 읽은 데이터로 저장소 전체를 교체합니다.
+    다른 모듈이 같은 리스트 객체를 참조하므로 재할당하지 않고 내용만 바꿉니다.
+
+    스냅샷은 마지막 저장 이후의 변경을 잃었을 수 있으므로(비정상 종료), 저장된 버전 번호를
+    그대로 쓰지 않고 한 단계 올려 이전 프로세스가 같은 번호로 발급한 응답과 겹치지 않게 합니다.
+    """
+    with write_lock, _version_lock:
+        users_db[:] = users
+        tasks_db[:] = tasks
+        news_db[:] = news
+        for name in collection_versions:
+            collection_versions[name] = max(collection_versions[name], versions.get(name, 1)) + 1
+        row_versions["users"] = {u.id: collection_versions["users"] for u in users}
+        row_versions["tasks"] = {t.id: collection_versions["tasks"] for t in tasks}
@@ -0,0 +1,351 @@
+"""
+부하 테스트 도구
+
+역할:
+1. api_server.py (단일 파일) 또는 api_server_modular.py (모듈화) 를 별도 프로세스로 실행
+2. 사용자/작업 CRUD + 뉴스 조회를 섞은 현실적인 요청을 동시에 전송
+3. 엔드포인트별 처리량(req/s) 과 p50/p95/p99 지연 시간 출력
+
+뉴스 API는 외부 사이트를 크롤링하지 않도록 가짜 뉴스 수집기로 대체됩니다.
+단일 파일 서버에는 뉴스 API가 없으므로 뉴스 요청은 자동으로 제외됩니다.
+
+실행:
+python load_test.py --target modular --target monolith --concurrency 16 --duration 20
+python load_test.py --target http://127.0.0.1:8000 --duration 10   # 이미 실행 중인 서버
+"""
+
+import argparse
+import http.client
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+ENTRY_POINTS = {
+    "modular": "api_server_modular",
+    "monolith": "api_server",
+}
+
+# (엔드포인트 이름, 가중치)
+REQUEST_MIX: List[Tuple[str, int]] = [
+    ("GET /api/users", 20),
+    ("GET /api/users/{id}", 15),
+    ("POST /api/users", 5),
+    ("PUT /api/users/{id}", 3),
+    ("DELETE /api/users/{id}", 2),
+    ("GET /api/tasks", 20),
+    ("GET /api/tasks?user_id=", 5),
+    ("GET /api/tasks/{id}", 10),
+    ("POST /api/tasks", 5),
+    ("PATCH /api/tasks/{id}", 5),
+    ("GET /api/news/top", 5),
+    ("GET /health", 5),
+]
+
+
+# ========== 서버 실행 (하위 프로세스) ==========
+def _stub_articles(n: int = 30):
+    """중복 제거 비용이 실제와 비슷하도록 유사 제목을 섞은 가짜 기사 목록"""
+    from models import NewsArticle
+
+    topics = ["국회 예산안", "환율 급등", "태풍 북상", "반도체 수출", "부동산 대책", "선거 여론조사"]
+    articles = []
+    for i in range(n):
+        topic = topics[i % len(topics)]
+        articles.append(NewsArticle(
+            title=f"{topic} 관련 속보 {i // len(topics)}보 - 주요 쟁점 정리",
+            url=f"https://news.example.com/{i}",
+            source=["SBS 뉴스", "연합뉴스", "네이버 뉴스 메인"][i % 3],
+            published_at="2025-01-01T09:00:00",
+            summary=f"{topic}에 대한 상세 보도입니다. " * 3,
+            hotness_score=15.0 if i % 3 == 2 else 0.0,
+        ))
+    return articles
+
+
+def serve(target: str, port: int, news_latency_ms: float) -> None:
+    """뉴스 수집기를 가짜로 바꾼 뒤 대상 서버를 실행합니다. (--serve 모드)"""
+    import importlib
+    import uvicorn
+
+    module = importlib.import_module(ENTRY_POINTS[target])
+    if target == "modular":
+        from services import news_fetcher
+
+        def fetch_all_news():
+            if news_latency_ms:
+                time.sleep(news_latency_ms / 1000.0)
+            return _stub_articles()
+
+        news_fetcher.fetch_all_news = fetch_all_news
+
+    uvicorn.run(module.app, host="127.0.0.1", port=port, log_level="warning", access_log=False)
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(target: str, news_latency_ms: float) -> Tuple[subprocess.Popen, str]:
+    """대상 서버를 하위 프로세스로 실행하고 /health 가 응답할 때까지 기다립니다."""
+    port = _free_port()
+    process = subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), "--serve", target,
+         "--port", str(port), "--news-latency-ms", str(news_latency_ms)],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        # 실행마다 같은 초기 상태에서 비교하도록 스냅샷 복원/저장 비활성화
+        env=dict(os.environ, SNAPSHOT_PATH=""),
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"{target} 서버가 시작되지 않았습니다 (exit {process.returncode})")
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            conn.request("GET", "/health")
+            if conn.getresponse().status == 200:
+                conn.close()
+                return process, base_url
+        except OSError:
+            time.sleep(0.1)
+    process.terminate()
+    raise RuntimeError(f"{target} 서버가 30초 안에 준비되지 않았습니다")
+
+
+# ========== 부하 생성 ==========
+class Worker(threading.Thread):
+    """keep-alive 연결 하나로 요청 믹스를 반복 전송하는 가상 클라이언트"""
+
+    def __init__(self, base_url: str, mix: List[Tuple[str, int]], stop_at: float,
+                 record_after: float, seed: int):
+        super().__init__(daemon=True)
+        parsed = urlparse(base_url)
+        self.host, self.port = parsed.hostname, parsed.port or 80
+        self.names = [name for name, _ in mix]
+        self.weights = [weight for _, weight in mix]
+        self.stop_at = stop_at
+        self.record_after = record_after
+        self.rng = random.Random(seed)
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.own_users: List[int] = []
+        self.own_tasks: List[int] = []
+        self.conn: Optional[http.client.HTTPConnection] = None
+
+    def _request(self, method: str, path: str, body: Optional[dict] = None) -> Tuple[int, bytes]:
+        if self.conn is None:
+            self.conn = http.client.HTTPConnection(self.host, self.port, timeout=30)
+        headers = {}
+        payload = None
+        if body is not None:
+            payload = json.dumps(body).encode()
+            headers["Content-Type"] = "application/json"
+        try:
+            self.conn.request(method, path, body=payload, headers=headers)
+            response = self.conn.getresponse()
+            return response.status, response.read()
+        except (OSError, http.client.HTTPException):
+            self.conn.close()
+            self.conn = None
+            raise
+
+    def _pick_user(self) -> int:
+        return self.rng.choice(self.own_users or [1, 2])
+
+    def _pick_task(self) -> int:
+        return self.rng.choice(self.own_tasks or [1, 2])
+
+    def _build(self, name: str) -> Tuple[str, str, Optional[dict]]:
+        rng = self.rng
+        if name == "GET /api/users":
+            return "GET", f"/api/users?skip={rng.randint(0, 20)}&limit=10", None
+        if name == "GET /api/users/{id}":
+            return "GET", f"/api/users/{self._pick_user()}", None
+        if name == "POST /api/users":
+            n = rng.randint(1, 10 ** 6)
+            return "POST", "/api/users", {"name": f"user{n}", "email": f"user{n}@example.com", "age": rng.randint(18, 70)}
+        if name == "PUT /api/users/{id}":
+            n = rng.randint(1, 10 ** 6)
+            return "PUT", f"/api/users/{self._pick_user()}", {"name": f"user{n}", "email": f"user{n}@example.com", "age": rng.randint(18, 70)}
+        if name == "DELETE /api/users/{id}":
+            if not self.own_users:
+                return self._build("POST /api/users")
+            return "DELETE", f"/api/users/{self.own_users.pop()}", None
+        if name == "GET /api/tasks":
+            return "GET", f"/api/tasks?skip={rng.randint(0, 20)}&limit=10", None
+        if name == "GET /api/tasks?user_id=":
+            return "GET", f"/api/tasks?user_id={self._pick_user()}", None
+        if name == "GET /api/tasks/{id}":
+            return "GET", f"/api/tasks/{self._pick_task()}", None
+        if name == "POST /api/tasks":
+            return "POST", "/api/tasks", {"title": "부하 테스트", "description": "자동 생성 작업", "user_id": self._pick_user()}
+        if name == "PATCH /api/tasks/{id}":
+            completed = "true" if rng.random() < 0.5 else "false"
+            return "PATCH", f"/api/tasks/{self._pick_task()}?completed={completed}", None
+        if name == "GET /api/news/top":
+            return "GET", f"/api/news/top?n=5&format={rng.choice(['json', 'markdown'])}", None
+        return "GET", "/health", None
+
+    def run(self) -> None:
+        while True:
+            now = time.perf_counter()
+            if now >= self.stop_at:
+                break
+            name = self.rng.choices(self.names, self.weights)[0]
+            method, path, body = self._build(name)
+            # DELETE 대상이 없어 POST로 대체된 경우 이름도 맞춤
+            if method == "POST" and name == "DELETE /api/users/{id}":
+                name = "POST /api/users"
+            start = time.perf_counter()
+            try:
+                status, data = self._request(method, path, body)
+            except (OSError, http.client.HTTPException):
+                status, data = 0, b""
+            elapsed = time.perf_counter() - start
+            if status == 200 and method == "POST":
+                created = json.loads(data).get("id")
+                (self.own_users if "users" in path else self.own_tasks).append(created)
+            if start < self.record_after:
+                continue
+            if status not in (200, 304):
+                self.errors[name] += 1
+            else:
+                self.latencies[name].append(elapsed)
+        if self.conn is not None:
+            self.conn.close()
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(pct / 100.0 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def run_load(base_url: str, mix: List[Tuple[str, int]], concurrency: int,
+             duration: float, warmup: float, seed: int) -> dict:
+    """부하를 생성하고 엔드포인트별 통계를 반환합니다."""
+    start = time.perf_counter()
+    record_after = start + warmup
+    stop_at = record_after + duration
+    workers = [Worker(base_url, mix, stop_at, record_after, seed + i) for i in range(concurrency)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+    for w in workers:
+        for name, values in w.latencies.items():
+            latencies[name].extend(values)
+        for name, n in w.errors.items():
+            errors[name] += n
+
+    def summarize(values: List[float], error_count: int) -> dict:
+        values = sorted(values)
+        return {
+            "requests": len(values),
+            "errors": error_count,
+            "rps": round(len(values) / duration, 1),
+            "p50_ms": round(_percentile(values, 50) * 1000, 2),
+            "p95_ms": round(_percentile(values, 95) * 1000, 2),
+            "p99_ms": round(_percentile(values, 99) * 1000, 2),
+        }
+
+    endpoints = {
+        name: summarize(latencies.get(name, []), errors.get(name, 0))
+        for name, _ in mix
+        if name in latencies or name in errors
+    }
+    all_values = [v for values in latencies.values() for v in values]
+    return {
+        "concurrency": concurrency,
+        "duration_s": duration,
+        "endpoints": endpoints,
+        "total": summarize(all_values, sum(errors.values())),
+    }
+
+
+# ========== 출력 ==========
+def print_report(label: str, result: dict) -> None:
+    print(f"\n📊 {label}  (동시성 {result['concurrency']}, {result['duration_s']}초)")
+    header = f"{'엔드포인트':<28}{'요청':>8}{'오류':>6}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+    print(header)
+    print("-" * len(header))
+    rows = list(result["endpoints"].items()) + [("합계", result["total"])]
+    for name, s in rows:
+        print(f"{name:<28}{s['requests']:>8}{s['errors']:>6}{s['rps']:>9}"
+              f"{s['p50_ms']:>9}{s['p95_ms']:>9}{s['p99_ms']:>9}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="로컬 API 서버 부하 테스트")
+    parser.add_argument("--target", action="append",
+                        help="modular, monolith 또는 실행 중인 서버 URL (여러 번 지정 가능)")
+    parser.add_argument("--concurrency", type=int, default=16, help="동시 가상 클라이언트 수")
+    parser.add_argument("--duration", type=float, default=15.0, help="측정 시간 (초)")
+    parser.add_argument("--warmup", type=float, default=2.0, help="통계에서 제외할 워밍업 시간 (초)")
+    parser.add_argument("--seed", type=int, default=42, help="요청 믹스 난수 시드")
+    parser.add_argument("--news-latency-ms", type=float, default=0.0,
+                        help="가짜 뉴스 수집기의 인위적 지연 (ms)")
+    parser.add_argument("--no-news", action="store_true", help="뉴스 요청 제외")
+    parser.add_argument("--json", metavar="PATH", help="결과를 JSON 파일로 저장")
+    parser.add_argument("--serve", choices=sorted(ENTRY_POINTS), help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, default=8000, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.serve, args.port, args.news_latency_ms)
+        return
+
+    targets = args.target or ["modular"]
+
+    # 모놀리식 서버에는 뉴스 API가 없으므로, 비교 결과가 같은 요청 믹스를 기준으로 하도록
+    # 대상 중 하나라도 monolith 이면 모든 대상에서 뉴스 요청을 제외
+    mix = REQUEST_MIX
+    if args.no_news or "monolith" in targets:
+        mix = [(name, w) for name, w in REQUEST_MIX if "/api/news" not in name]
+        if not args.no_news and len(targets) > 1:
+            print("ℹ️  monolith 에는 뉴스 API가 없어 모든 대상에서 뉴스 요청을 제외합니다")
+
+    results = {}
+    for target in targets:
+        process = None
+        if target in ENTRY_POINTS:
+            process, base_url = start_server(target, args.news_latency_ms)
+        else:
+            base_url = target
+        try:
+            result = run_load(base_url, mix, args.concurrency, args.duration, args.warmup, args.seed)
+        finally:
+            if process is not None:
+                process.terminate()
+                process.wait(timeout=10)
+        results[target] = result
+        print_report(target, result)
+
+    if len(results) > 1:
+        print("\n⚖️  비교 (합계)")
+        for target, result in results.items():
+            total = result["total"]
+            print(f"  {target:<30} {total['rps']:>9} req/s   p99 {total['p99_ms']} ms")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 결과 저장: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+"""
+미들웨어 패키지 초기화
+"""
+from . import admission, compression, metrics, profiling
+
+__all__ = ["admission", "compression", "metrics", "profiling"]
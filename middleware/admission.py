@@ -0,0 +1,181 @@
+"""
+요청 수락 제어(Admission Control) 미들웨어
+비용이 큰 라우트의 동시 실행 수를 제한하고, 대기열이 가득 차거나 대기 시간이 지나면
+즉시 503 + Retry-After 로 거절합니다. 선택적으로 클라이언트별 토큰 버킷 속도 제한(429)도 적용합니다.
+
+동시 실행 제한이 없으면 /api/news/top 같은 느린 요청이 스레드풀을 모두 차지해
+/health 나 GET /api/users/{id} 같은 가벼운 요청까지 함께 느려집니다.
+"""
+import asyncio
+import json
+import math
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from services.metrics import registry, labels
+
+# "METHOD 경로=동시실행:대기열" 을 쉼표로 구분 (경로는 정확히 일치해야 함)
+DEFAULT_LIMITS = "GET /api/news/top=2:4,GET /api/users=8:16,GET /api/tasks=8:16"
+ADMISSION_LIMITS = os.getenv("ADMISSION_LIMITS", DEFAULT_LIMITS)
+ADMISSION_QUEUE_TIMEOUT = float(os.getenv("ADMISSION_QUEUE_TIMEOUT_MS", "1000")) / 1000.0
+RETRY_AFTER_SECONDS = int(os.getenv("ADMISSION_RETRY_AFTER", "1"))
+
+# 클라이언트별 속도 제한 (RATE_LIMIT_RPS=0 이면 비활성화)
+RATE_LIMIT_RPS = float(os.getenv("RATE_LIMIT_RPS", "0"))
+RATE_LIMIT_BURST = float(os.getenv("RATE_LIMIT_BURST", "20"))
+RATE_LIMIT_EXEMPT = {"/health", "/metrics"}
+MAX_TRACKED_CLIENTS = 10000
+
+registry.describe("http_requests_shed_total", "counter", "수락 제어로 거절된 요청 수")
+
+
+class RouteLimiter:
+    """라우트 하나의 동시 실행 수와 대기열 길이를 제한 (이벤트 루프 스레드에서만 사용)"""
+
+    def __init__(self, name: str, path: str, limit: int, queue_size: int, timeout: float):
+        self.name = name
+        self.path = path
+        self.limit = limit
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.waiting = 0
+        # 실행 중 + 대기 중인 요청 수. await 전에 올려야 같은 이벤트 루프 차례에 몰려온 요청도 세어짐
+        self.admitted = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def acquire(self) -> Optional[str]:
+        """실행 슬롯을 얻으면 None, 거절되면 거절 사유를 반환합니다."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.limit)
+        if self.admitted >= self.limit + self.queue_size:
+            return "queue_full"
+
+        self.admitted += 1
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self.timeout)
+            return None
+        except asyncio.TimeoutError:
+            self.admitted -= 1
+            return "queue_timeout"
+        except asyncio.CancelledError:
+            self.admitted -= 1
+            raise
+        finally:
+            self.waiting -= 1
+
+    def release(self) -> None:
+        self.admitted -= 1
+        self._semaphore.release()
+
+
+class TokenBucketLimiter:
+    """클라이언트(IP)별 토큰 버킷. 오래 쓰지 않은 클라이언트부터 정리합니다."""
+
+    def __init__(self, rate: float, burst: float, max_clients: int = MAX_TRACKED_CLIENTS):
+        self.rate = rate
+        self.burst = burst
+        self.max_clients = max_clients
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    def consume(self, client: str) -> float:
+        """토큰을 하나 쓰고 0을 반환합니다. 토큰이 없으면 다시 시도할 때까지의 초를 반환합니다."""
+        now = time.monotonic()
+        tokens, updated = self._buckets.pop(client, (self.burst, now))
+        tokens = min(self.burst, tokens + (now - updated) * self.rate)
+        wait = 0.0
+        if tokens >= 1.0:
+            tokens -= 1.0
+        else:
+            wait = (1.0 - tokens) / self.rate
+        self._buckets[client] = (tokens, now)
+        while len(self._buckets) > self.max_clients:
+            self._buckets.popitem(last=False)
+        return wait
+
+
+def parse_limits(spec: str, timeout: float) -> Dict[Tuple[str, str], RouteLimiter]:
+    """ADMISSION_LIMITS 문자열을 (메서드, 경로) -> RouteLimiter 로 변환합니다."""
+    limiters: Dict[Tuple[str, str], RouteLimiter] = {}
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        route, _, numbers = item.rpartition("=")
+        method, _, path = route.strip().partition(" ")
+        limit, _, queue_size = numbers.partition(":")
+        limiters[(method.upper(), path.strip())] = RouteLimiter(
+            route.strip(), path.strip(), int(limit), int(queue_size or 0), timeout
+        )
+    return limiters
+
+
+async def _reject(send, status: int, detail: str, retry_after: int) -> None:
+    body = json.dumps({"detail": detail}, ensure_ascii=False).encode("utf-8")
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"retry-after", str(retry_after).encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+class AdmissionControlMiddleware:
+    """라우트별 동시 실행 제한 + 클라이언트별 속도 제한 ASGI 미들웨어"""
+
+    def __init__(
+        self,
+        app,
+        limits: str = ADMISSION_LIMITS,
+        queue_timeout: float = ADMISSION_QUEUE_TIMEOUT,
+        rate: float = RATE_LIMIT_RPS,
+        burst: float = RATE_LIMIT_BURST,
+    ):
+        self.app = app
+        self.limiters = parse_limits(limits, queue_timeout)
+        self.rate_limiter = TokenBucketLimiter(rate, burst) if rate > 0 else None
+        registry.register_gauge(
+            "admission_queue_depth",
+            "라우트별 수락 대기 중인 요청 수",
+            lambda: {labels(route=l.name): l.waiting for l in self.limiters.values()},
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        limiter = self.limiters.get((scope["method"], path))
+        if limiter is not None:
+            # 거절된 요청은 라우터에 닿지 않으므로 메트릭이 같은 라우트로 집계되도록 경로 템플릿을 남김
+            scope["route_template"] = limiter.path
+
+        if self.rate_limiter is not None and path not in RATE_LIMIT_EXEMPT:
+            client = scope.get("client")
+            wait = self.rate_limiter.consume(client[0] if client else "unknown")
+            if wait > 0:
+                # 원본 경로를 라벨로 쓰면 URL마다 시계열이 생기므로 고정 값 사용
+                registry.inc("http_requests_shed_total", labels(route="*", reason="rate_limit"))
+                await _reject(send, 429, "요청이 너무 많습니다. 잠시 후 다시 시도하세요", math.ceil(wait))
+                return
+
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        reason = await limiter.acquire()
+        if reason is not None:
+            registry.inc("http_requests_shed_total", labels(route=limiter.name, reason=reason))
+            await _reject(send, 503, "서버가 혼잡합니다. 잠시 후 다시 시도하세요", RETRY_AFTER_SECONDS)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
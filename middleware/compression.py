@@ -0,0 +1,89 @@
+"""
+응답 압축 미들웨어
+Accept-Encoding 에 따라 gzip / brotli 로 응답 본문을 압축합니다.
+
+ETag 응답(cached_json_response)은 이미 버전별 압축본을 캐시해 Content-Encoding 을 붙여 보내므로 그대로 통과시키고,
+나머지 응답(뉴스 목록, 마크다운 요약, 검색 결과 등)은 본문 해시를 키로 압축본을 캐시합니다.
+뉴스 내용이 바뀌지 않았다면 같은 요약을 요청마다 다시 압축하지 않습니다.
+"""
+import hashlib
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from services.compression import COMPRESS_MIN_BYTES, compress, is_compressible, negotiate
+from services.response_cache import ResponseCache
+
+# (본문 해시, 인코딩) -> 압축된 본문
+compressed_cache = ResponseCache(max_entries=256)
+
+
+def compress_cached(body: bytes, encoding: str) -> bytes:
+    """내용이 같은 본문은 한 번만 압축하도록 본문 해시로 압축 결과를 캐시합니다."""
+    key = (hashlib.blake2b(body, digest_size=16).digest(), encoding)
+    compressed = compressed_cache.get(key)
+    if compressed is None:
+        compressed = compress(body, encoding)
+        compressed_cache.put(key, compressed)
+    return compressed
+
+
+class CompressionMiddleware:
+    """최소 크기 이상의 텍스트/JSON 응답을 압축하는 ASGI 미들웨어"""
+
+    def __init__(self, app, minimum_size: int = COMPRESS_MIN_BYTES):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        chunks = []
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if (
+                    message["status"] != 200
+                    or "content-encoding" in headers
+                    or not is_compressible(headers.get("content-type", ""))
+                ):
+                    passthrough = True
+                    await send(message)
+                else:
+                    start_message = message
+                return
+
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                if len(chunks) == 1:
+                    # 스트리밍 응답은 버퍼링하지 않고 압축 없이 그대로 전달
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                return
+
+            body = b"".join(chunks)
+            if len(body) >= self.minimum_size:
+                body = compress_cached(body, encoding)
+                headers = MutableHeaders(scope=start_message)
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(body))
+                headers.add_vary_header("Accept-Encoding")
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_wrapper)
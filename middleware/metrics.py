@@ -0,0 +1,45 @@
+"""
+메트릭 수집 미들웨어
+라우트/상태 코드별 지연 시간 히스토그램과 처리 중인 요청 수를 기록합니다.
+"""
+import time
+
+from services.metrics import registry, labels
+
+_IN_FLIGHT = "http_requests_in_flight"
+
+
+class MetricsMiddleware:
+    """요청 단위 지연 시간을 기록하는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        registry.inc(_IN_FLIGHT)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            registry.inc(_IN_FLIGHT, value=-1.0)
+            # 경로 파라미터별로 라벨이 늘어나지 않도록 라우트 템플릿을 사용
+            # (수락 제어로 거절되어 라우터에 닿지 않은 요청은 수락 제어가 남긴 템플릿 사용)
+            route = scope.get("route")
+            path = getattr(route, "path", None) or scope.get("route_template") or "unmatched"
+            metric_labels = labels(method=scope["method"], route=path, status=status_code)
+            registry.inc("http_requests_total", metric_labels)
+            registry.observe(
+                "http_request_duration_seconds", metric_labels, time.perf_counter() - start
+            )
@@ -0,0 +1,38 @@
+"""
+느린 요청 프로파일링 미들웨어
+요청 시작/종료를 SlowRequestCapture에 등록해 임계값을 넘긴 요청의 스택을 수집합니다.
+"""
+import asyncio
+
+from fastapi.routing import APIRoute
+
+from services.profiler import SlowRequestCapture, track_request_thread
+
+
+def instrument_routes(app) -> None:
+    """
+    동기 엔드포인트가 실행되는 워커 스레드를 요청에 연결하도록 감쌉니다.
+    (라우터를 모두 등록한 뒤 호출해야 함)
+    """
+    for route in app.routes:
+        if isinstance(route, APIRoute) and not asyncio.iscoroutinefunction(route.dependant.call):
+            route.dependant.call = track_request_thread(route.dependant.call)
+
+
+class SlowRequestMiddleware:
+    """임계값을 넘긴 요청의 프로파일을 자동 수집하는 ASGI 미들웨어"""
+
+    def __init__(self, app, capture: SlowRequestCapture):
+        self.app = app
+        self.capture = capture
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = self.capture.begin(scope["method"], scope["path"])
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.capture.end(token)
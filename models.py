@@ -2,7 +2,7 @@
 데이터 모델 정의
 """
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 
 
 class User(BaseModel):
@@ -33,3 +33,16 @@ class NewsArticle(BaseModel):
     view_count: Optional[int] = 0
     comment_count: Optional[int] = 0
     hotness_score: Optional[float] = 0.0
+
+
+class TaskFilter(BaseModel):
+    """작업 일괄 변경 대상 조건 (지정한 조건을 모두 만족하는 작업)"""
+    user_id: Optional[int] = None
+    completed: Optional[bool] = None
+
+
+class TaskBatchUpdate(BaseModel):
+    """작업 일괄 상태 변경 요청 (ids 또는 filter 중 하나를 지정)"""
+    completed: bool
+    ids: Optional[List[int]] = None
+    filter: Optional[TaskFilter] = None
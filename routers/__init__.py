@@ -1,6 +1,9 @@
 """
 라우터 패키지 초기화
+
+하위 모듈은 여기서 import 하지 않습니다.
+`from routers import users` 처럼 필요한 라우터만 불러오면 해당 모듈만 로드되므로,
+뉴스 라우터를 쓰지 않는 배포에서는 뉴스 수집 의존성이 로드되지 않습니다.
 """
-from . import users, tasks, system, news
 
-__all__ = ["users", "tasks", "system", "news"]
+__all__ = ["users", "tasks", "system", "news", "search", "admin"]
@@ -0,0 +1,54 @@
+"""
+관리자 전용 API 라우터 (프로파일링)
+ADMIN_TOKEN 환경 변수가 설정되지 않으면 모든 엔드포인트가 비활성화됩니다.
+"""
+import hmac
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from typing import List, Optional
+from services import profiler
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None)) -> None:
+    """X-Admin-Token 헤더를 ADMIN_TOKEN과 비교합니다."""
+    if not profiler.ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="관리자 기능이 비활성화되어 있습니다")
+    if not x_admin_token or not hmac.compare_digest(x_admin_token, profiler.ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="관리자 토큰이 올바르지 않습니다")
+
+
+router = APIRouter(prefix="/admin", tags=["Admin"], dependencies=[Depends(require_admin)])
+
+
+@router.post("/profile", summary="샘플링 프로파일 수집", response_class=Response)
+def profile(seconds: float = Query(5.0, description="수집 시간 (초)", gt=0, le=60)) -> Response:
+    """
+    실행 중인 프로세스의 모든 스레드 스택을 샘플링합니다.
+    응답은 collapsed-stack 형식이며 `flamegraph.pl` 또는 speedscope로 시각화할 수 있습니다.
+    """
+    collapsed = profiler.run_profile(seconds)
+    if collapsed is None:
+        raise HTTPException(status_code=409, detail="이미 프로파일을 수집 중입니다")
+    return Response(
+        content=collapsed,
+        media_type="text/plain; charset=utf-8",
+        headers={"Content-Disposition": 'attachment; filename="profile.collapsed"'},
+    )
+
+
+@router.get("/slow-requests", summary="느린 요청 프로파일 목록")
+def list_slow_requests() -> List[dict]:
+    """SLOW_REQUEST_THRESHOLD_MS를 넘긴 요청의 최근 캡처 목록을 반환합니다."""
+    capture = profiler.slow_request_capture
+    if capture is None:
+        return []
+    return [{k: v for k, v in c.items() if k != "profile"} for c in capture.captures]
+
+
+@router.get("/slow-requests/{capture_id}", summary="느린 요청 프로파일 다운로드", response_class=Response)
+def get_slow_request(capture_id: int) -> Response:
+    """특정 캡처의 collapsed-stack 프로파일을 반환합니다."""
+    capture = profiler.slow_request_capture
+    found = next((c for c in (capture.captures if capture else []) if c["id"] == capture_id), None)
+    if not found:
+        raise HTTPException(status_code=404, detail="캡처를 찾을 수 없습니다")
+    return Response(content=found["profile"], media_type="text/plain; charset=utf-8")
@@ -4,7 +4,9 @@
 from fastapi import APIRouter, Query, HTTPException
 from typing import List, Union, Optional
 from models import NewsArticle
-from services import news_fetcher, news_processor, news_summarizer
+from services import news_fetcher, news_processor, news_summarizer, search_index, trending
+from services.metrics import time_stage
+from database import replace_news
 
 router = APIRouter(prefix="/api/news", tags=["News"])
 
@@ -23,22 +25,48 @@ def get_top_news(
         if not all_articles:
             raise HTTPException(status_code=500, detail="뉴스를 수집할 수 없습니다.")
         
+        # 마지막 수집 결과 보관 (스냅샷에 포함)
+        replace_news(all_articles)
+        search_index.sync_news(all_articles)
+        
         # 2. 중복 제거 및 상위 N개 선별
         top_news = news_processor.get_top_n_news(all_articles, n=n)
         
         # 3. 형식에 맞게 응답
         if format.lower() == "markdown":
-            markdown_content = news_summarizer.format_as_markdown(top_news)
+            with time_stage("render"):
+                markdown_content = news_summarizer.format_as_markdown(top_news)
             return {"markdown": markdown_content}
         
         # JSON 형식인 경우 요약 추가
-        for article in top_news:
-            article.summary = news_summarizer.summarize_article(article)
+        with time_stage("render"):
+            for article in top_news:
+                article.summary = news_summarizer.summarize_article(article)
+                search_index.index_news(article)
             
         return top_news
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/trending", summary="트렌드 뉴스 조회")
+def get_trending_news(
+    limit: int = Query(10, description="반환할 이야기 개수", ge=1, le=50),
+) -> dict:
+    """
+    최근 시간 창(기본 1시간) 동안 보도하는 소스 수가 빠르게 늘고 있는 이야기를 반환합니다.
+    `/api/news/top` 으로 뉴스를 수집할 때마다 갱신되며, 이 API 자체는 뉴스를 수집하지 않습니다.
+
+    - **velocity**: 현재 버킷 소스 수 - 직전 버킷 소스 수
+    - **current**: 현재 버킷에서 보도한 소스 수
+    - **mentions**: 시간 창 안의 버킷별 소스 수 합계
+    """
+    tracker = trending.tracker
+    return {
+        "window_minutes": tracker.num_buckets * tracker.bucket // 60,
+        "bucket_minutes": tracker.bucket // 60,
+        "stories": tracker.top(limit),
+    }
+
 @router.get("/test-fetch", summary="뉴스 수집 테스트")
 def test_fetch():
     """뉴스 수집이 정상적으로 작동하는지 테스트합니다."""
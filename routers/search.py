@@ -0,0 +1,44 @@
+"""
+통합 검색 API 라우터
+"""
+import time
+from fastapi import APIRouter, HTTPException, Query
+from services import search_index
+
+router = APIRouter(prefix="/api/search", tags=["Search"])
+
+
+@router.get("", summary="사용자 / 작업 / 뉴스 통합 검색")
+def search(
+    q: str = Query(..., min_length=1, description="검색어 (부분 일치, 한국어 지원)"),
+    types: str = Query("users,tasks,news", description="검색할 대상 (쉼표로 구분)"),
+    limit: int = Query(10, ge=1, le=100, description="반환할 최대 결과 수"),
+) -> dict:
+    """
+    사용자(이름, 이메일), 작업(제목, 설명), 마지막으로 수집한 뉴스(제목, 요약)를 검색합니다.
+    검색어의 모든 두 글자 조각을 포함하는 항목을 관련도 순으로 반환합니다.
+
+    예: `/api/search?q=배포&types=tasks,news`
+
+    스냅샷 복원 직후 검색 인덱스를 백그라운드에서 만드는 동안은 `indexing` 이 true 이며,
+    그동안 사용자/작업 결과가 빠질 수 있습니다.
+    """
+    collections = [name.strip() for name in types.split(",") if name.strip()]
+    unknown = [name for name in collections if name not in search_index.indexes]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"알 수 없는 검색 대상: {', '.join(unknown)}")
+
+    start = time.perf_counter()
+    results = search_index.search(q, collections, limit)
+    took_ms = (time.perf_counter() - start) * 1000
+
+    return {
+        "query": q,
+        "took_ms": round(took_ms, 3),
+        "total": len(results),
+        "indexing": search_index.rebuilding(),
+        "results": [
+            {"type": name, "score": score, "item": item}
+            for name, score, item in results
+        ],
+    }
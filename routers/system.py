@@ -1,17 +1,60 @@
 """
 시스템 관련 API 라우터
 """
-from fastapi import APIRouter
+import os
+from fastapi import APIRouter, Response
 from database import users_db, tasks_db
+from services.metrics import registry, labels
+from services.response_cache import response_cache
+from middleware.compression import compressed_cache
 
 router = APIRouter(tags=["System"])
 
 
+registry.register_gauge(
+    "store_items",
+    "인메모리 저장소 컬렉션별 항목 수",
+    lambda: {
+        labels(collection="users"): len(users_db),
+        labels(collection="tasks"): len(tasks_db),
+        labels(collection="response_cache"): len(response_cache),
+    },
+)
+registry.register_gauge(
+    "cache_hits_total",
+    "캐시 적중 횟수",
+    lambda: {
+        labels(cache="response"): response_cache.hits,
+        labels(cache="compression"): compressed_cache.hits,
+    },
+    kind="counter",
+)
+registry.register_gauge(
+    "cache_misses_total",
+    "캐시 미스 횟수",
+    lambda: {
+        labels(cache="response"): response_cache.misses,
+        labels(cache="compression"): compressed_cache.misses,
+    },
+    kind="counter",
+)
+
+
 @router.get("/health", summary="서버 상태 확인")
 def health_check() -> dict:
     """서버가 정상 작동 중인지 확인합니다."""
     return {
         "status": "healthy",
+        "pid": os.getpid(),  # 무중단 배포 시 새 인스턴스 식별용
         "users_count": len(users_db),
         "tasks_count": len(tasks_db)
     }
+
+
+@router.get("/metrics", summary="Prometheus 메트릭", response_class=Response)
+def metrics() -> Response:
+    """라우트별 지연 시간, 뉴스 파이프라인 단계 시간, 저장소 크기, 캐시 적중률을 Prometheus 텍스트 형식으로 반환합니다."""
+    return Response(
+        content=registry.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
@@ -1,50 +1,145 @@
 """
 작업 관련 API 라우터
 """
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from typing import List, Optional
-from models import Task
-from database import tasks_db
+from models import Task, TaskBatchUpdate
+from database import (
+    tasks_db, write_lock, bump_version, bump_versions, get_collection_version, get_row_version,
+)
+from services.response_cache import make_etag, cached_json_response
+from services import search_index, store_index
 
 router = APIRouter(prefix="/api/tasks", tags=["Tasks"])
 
 
-@router.get("", summary="모든 작업 조회")
-def get_tasks(user_id: Optional[int] = None, skip: int = 0, limit: int = 10) -> List[Task]:
+@router.get("", summary="모든 작업 조회", response_model=List[Task])
+def get_tasks(
+    request: Request,
+    user_id: Optional[int] = None,
+    skip: int = Query(0, ge=0, description="건너뛸 항목 수"),
+    limit: int = Query(10, ge=1, description="반환할 최대 항목 수"),
+    fields: Optional[str] = Query(None, description="반환할 필드 (예: id,title,completed)"),
+    sort: Optional[str] = Query(None, description="정렬 필드, 앞에 -를 붙이면 내림차순 (예: -id)"),
+) -> Response:
     """
     작업 목록을 조회합니다.
-    - **user_id**: (선택) 특정 사용자의 작업만 필터링
+    - **user_id**: (선택) 특정 사용자의 작업만 필터링 (user_id 인덱스에서 조회)
+    - **fields**: 지정한 필드만 직렬화
+    - **sort**: id, title, completed, user_id 중 하나 (정렬 인덱스에서 조회)
+
+    응답에는 약한 ETag가 포함되며, `If-None-Match`가 일치하면 304를 반환합니다.
     """
-    filtered = tasks_db
-    if user_id:
-        filtered = [t for t in tasks_db if t.user_id == user_id]
-    return filtered[skip:skip + limit]
+    try:
+        selected = store_index.parse_fields(Task, fields)
+        order = store_index.parse_sort("tasks", sort)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    def build() -> list:
+        owner = user_id or None
+        page = store_index.select(
+            store_index.tasks, tasks_db, skip, limit, order,
+            range_field="user_id", low=owner, high=owner,
+        )
+        return store_index.project(page, selected)
 
+    version = get_collection_version("tasks")
+    return cached_json_response(request, "tasks", version, make_etag("tasks", version), build)
 
-@router.get("/{task_id}", summary="특정 작업 조회")
-def get_task(task_id: int) -> Task:
+
+@router.get("/{task_id}", summary="특정 작업 조회", response_model=Task)
+def get_task(request: Request, task_id: int) -> Response:
     """특정 ID의 작업 정보를 조회합니다."""
-    task = next((t for t in tasks_db if t.id == task_id), None)
+    task = store_index.tasks.get(task_id)
     if not task:
         raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
-    return task
+    version = get_row_version("tasks", task_id)
+    return cached_json_response(
+        request, f"tasks/{task_id}", version, make_etag("tasks", task_id, version),
+        lambda: task,
+    )
 
 
 @router.post("", summary="새 작업 생성", response_model=Task)
 def create_task(task: Task) -> Task:
     """새로운 작업을 생성합니다."""
-    new_id = max((t.id for t in tasks_db), default=0) + 1
-    task.id = new_id
-    tasks_db.append(task)
+    # ID 발급부터 인덱스 갱신까지 한 번에 (동시 생성 시 ID 중복 방지)
+    with write_lock:
+        new_id = max((t.id for t in tasks_db), default=0) + 1
+        task.id = new_id
+        tasks_db.append(task)
+        bump_version("tasks", new_id)
+        store_index.tasks.add(task)
+        search_index.index_task(task)
     return task
 
 
+# "/{task_id}" 보다 먼저 등록해야 "batch" 가 작업 ID로 해석되지 않음
+@router.patch("/batch", summary="작업 상태 일괄 업데이트")
+def update_tasks_batch(batch: TaskBatchUpdate) -> dict:
+    """
+    여러 작업의 완료 상태를 한 번에 변경합니다.
+    - **ids**: 변경할 작업 ID 목록 (없는 ID가 하나라도 있으면 아무것도 바꾸지 않고 404)
+    - **filter**: 조건을 모두 만족하는 작업 전체 (user_id / completed 인덱스에서 조회)
+
+    요청 예시:
+    ```json
+    {
+        "filter": {"user_id": 1, "completed": false},
+        "completed": true
+    }
+    ```
+    """
+    if (batch.ids is None) == (batch.filter is None):
+        raise HTTPException(status_code=400, detail="ids 와 filter 중 하나만 지정해야 합니다")
+    condition = batch.filter
+    if condition is not None and condition.user_id is None and condition.completed is None:
+        raise HTTPException(status_code=400, detail="filter 조건이 비어 있습니다")
+
+    with write_lock:
+        if batch.ids is not None:
+            ids = list(dict.fromkeys(batch.ids))
+            missing = [task_id for task_id in ids if store_index.tasks.get(task_id) is None]
+            if missing:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"작업을 찾을 수 없습니다: {', '.join(map(str, missing))}",
+                )
+            targets = list(store_index.tasks.items(ids))
+        elif condition.user_id is not None:
+            ids = store_index.tasks.range_ids("user_id", condition.user_id, condition.user_id)
+            targets = [
+                t for t in store_index.tasks.items(ids)
+                if condition.completed is None or t.completed == condition.completed
+            ]
+        else:
+            ids = store_index.tasks.range_ids("completed", condition.completed, condition.completed)
+            targets = list(store_index.tasks.items(ids))
+
+        changed = [t for t in targets if t.completed != batch.completed]
+        for task in changed:
+            task.completed = batch.completed
+            store_index.tasks.add(task)
+        if changed:
+            bump_versions("tasks", [t.id for t in changed])
+
+    return {
+        "matched": len(targets),
+        "updated": len(changed),
+        "ids": [t.id for t in changed],
+    }
+
+
 @router.patch("/{task_id}", summary="작업 상태 업데이트")
 def update_task_status(task_id: int, completed: bool) -> Task:
     """작업의 완료 상태를 업데이트합니다."""
-    task = next((t for t in tasks_db if t.id == task_id), None)
-    if not task:
-        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
-    
-    task.completed = completed
+    with write_lock:
+        task = store_index.tasks.get(task_id)
+        if not task:
+            raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+
+        task.completed = completed
+        bump_version("tasks", task_id)
+        store_index.tasks.add(task)
     return task
@@ -1,31 +1,67 @@
 """
 사용자 관련 API 라우터
 """
-from fastapi import APIRouter, HTTPException
-from typing import List
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from typing import List, Optional
 from models import User
-from database import users_db
+from database import (
+    users_db, tasks_db, write_lock,
+    bump_version, bump_versions, get_collection_version, get_row_version,
+)
+from services.response_cache import make_etag, cached_json_response
+from services import search_index, store_index
 
 router = APIRouter(prefix="/api/users", tags=["Users"])
 
 
-@router.get("", summary="모든 사용자 조회")
-def get_users(skip: int = 0, limit: int = 10) -> List[User]:
+@router.get("", summary="모든 사용자 조회", response_model=List[User])
+def get_users(
+    request: Request,
+    skip: int = Query(0, ge=0, description="건너뛸 항목 수"),
+    limit: int = Query(10, ge=1, description="반환할 최대 항목 수"),
+    fields: Optional[str] = Query(None, description="반환할 필드 (예: id,name)"),
+    sort: Optional[str] = Query(None, description="정렬 필드, 앞에 -를 붙이면 내림차순 (예: -age)"),
+    age_min: Optional[int] = Query(None, description="최소 나이 (포함)"),
+    age_max: Optional[int] = Query(None, description="최대 나이 (포함)"),
+) -> Response:
     """
     모든 사용자 정보를 조회합니다.
     - **skip**: 건너뛸 항목 수
     - **limit**: 반환할 최대 항목 수
+    - **fields**: 지정한 필드만 직렬화
+    - **sort**: id, name, email, age 중 하나 (정렬 인덱스에서 조회)
+    - **age_min / age_max**: 나이 구간 필터 (정렬을 지정하지 않으면 나이 순)
+
+    응답에는 약한 ETag가 포함되며, `If-None-Match`가 일치하면 304를 반환합니다.
     """
-    return users_db[skip:skip + limit]
+    try:
+        selected = store_index.parse_fields(User, fields)
+        order = store_index.parse_sort("users", sort)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    def build() -> list:
+        page = store_index.select(
+            store_index.users, users_db, skip, limit, order,
+            range_field="age", low=age_min, high=age_max,
+        )
+        return store_index.project(page, selected)
+
+    version = get_collection_version("users")
+    return cached_json_response(request, "users", version, make_etag("users", version), build)
 
 
-@router.get("/{user_id}", summary="특정 사용자 조회")
-def get_user(user_id: int) -> User:
+@router.get("/{user_id}", summary="특정 사용자 조회", response_model=User)
+def get_user(request: Request, user_id: int) -> Response:
     """특정 ID의 사용자 정보를 조회합니다."""
-    user = next((u for u in users_db if u.id == user_id), None)
+    user = store_index.users.get(user_id)
     if not user:
         raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
-    return user
+    version = get_row_version("users", user_id)
+    return cached_json_response(
+        request, f"users/{user_id}", version, make_etag("users", user_id, version),
+        lambda: user,
+    )
 
 
 @router.post("", summary="새 사용자 생성", response_model=User)
@@ -42,32 +78,72 @@ def create_user(user: User) -> User:
     }
     ```
     """
-    new_id = max((u.id for u in users_db), default=0) + 1
-    user.id = new_id
-    users_db.append(user)
+    # ID 발급부터 인덱스 갱신까지 한 번에 (동시 생성 시 ID 중복 방지)
+    with write_lock:
+        new_id = max((u.id for u in users_db), default=0) + 1
+        user.id = new_id
+        users_db.append(user)
+        bump_version("users", new_id)
+        store_index.users.add(user)
+        search_index.index_user(user)
     return user
 
 
 @router.put("/{user_id}", summary="사용자 정보 수정")
 def update_user(user_id: int, updated_user: User) -> User:
     """특정 ID의 사용자 정보를 수정합니다."""
-    user = next((u for u in users_db if u.id == user_id), None)
-    if not user:
-        raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
-    
-    user.name = updated_user.name
-    user.email = updated_user.email
-    user.age = updated_user.age
+    with write_lock:
+        user = store_index.users.get(user_id)
+        if not user:
+            raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
+
+        user.name = updated_user.name
+        user.email = updated_user.email
+        user.age = updated_user.age
+        bump_version("users", user_id)
+        store_index.users.add(user)
+        search_index.index_user(user)
     return user
 
 
+def _delete_user_tasks(user_id: int) -> int:
+    """user_id 인덱스로 사용자의 작업을 찾아 한 번에 삭제하고 삭제한 수를 반환합니다."""
+    task_ids = store_index.tasks.range_ids("user_id", user_id, user_id)
+    if not task_ids:
+        return 0
+
+    doomed = set(task_ids)
+    tasks_db[:] = [t for t in tasks_db if t.id not in doomed]
+    for task_id in task_ids:
+        store_index.tasks.remove(task_id)
+        search_index.remove_task(task_id)
+    bump_versions("tasks", task_ids, deleted=True)
+    return len(task_ids)
+
+
 @router.delete("/{user_id}", summary="사용자 삭제")
-def delete_user(user_id: int) -> dict:
-    """특정 ID의 사용자를 삭제합니다."""
-    global users_db
-    user = next((u for u in users_db if u.id == user_id), None)
-    if not user:
-        raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
-    
-    users_db = [u for u in users_db if u.id != user_id]
-    return {"message": "사용자가 삭제되었습니다", "id": user_id}
+def delete_user(
+    user_id: int,
+    cascade: Optional[str] = Query(
+        None, pattern="^tasks$", description="tasks 지정 시 사용자의 작업도 함께 삭제"
+    ),
+) -> dict:
+    """
+    특정 ID의 사용자를 삭제합니다.
+    `?cascade=tasks` 를 지정하면 해당 사용자의 작업도 같은 락 안에서 함께 삭제합니다.
+    """
+    with write_lock:
+        user = store_index.users.get(user_id)
+        if not user:
+            raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
+
+        # 다른 모듈과 공유하는 리스트이므로 재할당하지 않고 제자리에서 제거
+        users_db.remove(user)
+        bump_version("users", user_id, deleted=True)
+        store_index.users.remove(user_id)
+        search_index.remove_user(user_id)
+
+        result = {"message": "사용자가 삭제되었습니다", "id": user_id}
+        if cascade == "tasks":
+            result["deleted_tasks"] = _delete_user_tasks(user_id)
+    return result
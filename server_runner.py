@@ -0,0 +1,23 @@
+"""
+API 서버 실행 헬퍼
+무중단(blue/green) 배포 시 기존 서버와 새 서버가 같은 포트를 동시에 열 수 있도록
+API_REUSEPORT=1 이면 SO_REUSEPORT 소켓을 직접 만들어 uvicorn에 넘깁니다.
+"""
+import os
+import socket
+
+
+def run_server(app, host: str = "127.0.0.1", port: int = 8000) -> None:
+    """uvicorn으로 앱을 실행합니다."""
+    import uvicorn
+
+    if os.getenv("API_REUSEPORT") != "1" or not hasattr(socket, "SO_REUSEPORT"):
+        uvicorn.run(app, host=host, port=port)
+        return
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    # SIGTERM 수신 시 uvicorn이 새 연결 수락을 멈추고 처리 중인 요청을 마친 뒤 종료
+    uvicorn.Server(uvicorn.Config(app, host=host, port=port)).run(sockets=[sock])
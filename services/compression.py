@@ -0,0 +1,66 @@
+"""
+응답 압축 모듈
+Accept-Encoding 협상과 gzip / brotli 압축을 담당합니다.
+
+brotli 는 선택 의존성입니다. (`pip install brotli` 시 br 우선 사용, 없으면 gzip 만 사용)
+"""
+import gzip
+import os
+from typing import Optional
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성
+    brotli = None
+
+# 이 크기(바이트) 미만의 응답은 압축하지 않음 (압축 이득보다 CPU 비용이 큼)
+COMPRESS_MIN_BYTES = int(os.getenv("COMPRESS_MIN_BYTES", "1024"))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "5"))
+
+# 서버 선호 순서
+SUPPORTED_ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript")
+
+
+def negotiate(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Accept-Encoding 헤더에서 사용할 인코딩을 고릅니다.
+    q 값이 가장 높은 인코딩을 고르고, 같으면 서버 선호 순서(br > gzip)를 따릅니다.
+    """
+    if not accept_encoding:
+        return None
+
+    weights = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name] = q
+
+    best, best_q = None, 0.0
+    for encoding in SUPPORTED_ENCODINGS:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """본문을 지정한 인코딩으로 압축합니다."""
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    # mtime=0 으로 고정해 같은 본문은 항상 같은 바이트가 되도록 함
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def is_compressible(content_type: str) -> bool:
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
@@ -0,0 +1,190 @@
+"""
+메트릭 수집 모듈
+카운터/게이지/히스토그램을 기록하고 Prometheus 텍스트 형식으로 내보냅니다.
+
+기록 경로에는 락이 없습니다. 각 스레드는 자신만의 샤드(dict)에만 쓰고,
+스크레이프 시점에 모든 샤드를 합산합니다.
+"""
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+Labels = Tuple[Tuple[str, str], ...]
+
+# 기본 히스토그램 버킷 (초 단위)
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+
+def labels(**kwargs: object) -> Labels:
+    """키워드 인자로 라벨 튜플을 만듭니다. (None 값은 제외)"""
+    return tuple((k, str(v)) for k, v in kwargs.items() if v is not None)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(label_set: Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(label_set)
+    if extra is not None:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+class MetricsRegistry:
+    """스레드별 샤드에 기록하고 스크레이프 시 합산하는 메트릭 저장소"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._local = threading.local()
+        self._shards: List[Dict[str, dict]] = []
+        self._shards_lock = threading.Lock()  # 샤드 등록 시에만 사용
+        self._meta: Dict[str, Tuple[str, str]] = {}
+        self._gauge_callbacks: Dict[str, Callable[[], Dict[Labels, float]]] = {}
+
+    # ---------- 등록 ----------
+    def describe(self, name: str, kind: str, help_text: str) -> None:
+        """메트릭 이름에 대한 TYPE/HELP 정보를 등록합니다."""
+        self._meta[name] = (kind, help_text)
+
+    def register_gauge(
+        self,
+        name: str,
+        help_text: str,
+        callback: Callable[[], Dict[Labels, float]],
+        kind: str = "gauge",
+    ) -> None:
+        """
+        스크레이프 시점에 값을 계산하는 메트릭을 등록합니다.
+        다른 모듈이 이미 집계하고 있는 카운터는 kind="counter"로 노출합니다.
+        """
+        self.describe(name, kind, help_text)
+        self._gauge_callbacks[name] = callback
+
+    # ---------- 기록 ----------
+    def _shard(self) -> Dict[str, dict]:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = {"values": {}, "hist": {}}
+            with self._shards_lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+        return shard
+
+    def inc(self, name: str, label_set: Labels = (), value: float = 1.0) -> None:
+        """카운터(또는 증감형 게이지)를 value만큼 증가시킵니다."""
+        values = self._shard()["values"]
+        key = (name, label_set)
+        values[key] = values.get(key, 0.0) + value
+
+    def observe(self, name: str, label_set: Labels, value: float) -> None:
+        """히스토그램에 관측값을 기록합니다."""
+        hist = self._shard()["hist"]
+        key = (name, label_set)
+        slots = hist.get(key)
+        if slots is None:
+            # [버킷별 개수..., +Inf 개수, 합계]
+            slots = hist[key] = [0.0] * (len(self.buckets) + 2)
+        slots[bisect_left(self.buckets, value)] += 1
+        slots[-1] += value
+
+    @contextmanager
+    def timer(self, name: str, label_set: Labels = ()) -> Iterator[None]:
+        """블록 실행 시간을 히스토그램에 기록합니다."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, label_set, time.perf_counter() - start)
+
+    # ---------- 조회 ----------
+    def _collect(self) -> Tuple[Dict[tuple, float], Dict[tuple, List[float]]]:
+        with self._shards_lock:
+            shards = list(self._shards)
+        values: Dict[tuple, float] = {}
+        hist: Dict[tuple, List[float]] = {}
+        for shard in shards:
+            for key, value in shard["values"].copy().items():
+                values[key] = values.get(key, 0.0) + value
+            for key, slots in shard["hist"].copy().items():
+                merged = hist.setdefault(key, [0.0] * len(slots))
+                for i, count in enumerate(list(slots)):
+                    merged[i] += count
+        return values, hist
+
+    def get_value(self, name: str, label_set: Labels = ()) -> float:
+        """카운터 값을 합산해 반환합니다."""
+        values, _ = self._collect()
+        return values.get((name, label_set), 0.0)
+
+    def render(self) -> str:
+        """모든 메트릭을 Prometheus 텍스트 형식으로 변환합니다."""
+        values, hist = self._collect()
+        by_name: Dict[str, List[str]] = {}
+
+        for (name, label_set), value in sorted(values.items()):
+            by_name.setdefault(name, []).append(
+                f"{name}{_format_labels(label_set)} {_format_value(value)}"
+            )
+
+        for name, callback in self._gauge_callbacks.items():
+            try:
+                samples = callback()
+            except Exception:
+                continue
+            for label_set, value in samples.items():
+                by_name.setdefault(name, []).append(
+                    f"{name}{_format_labels(label_set)} {_format_value(value)}"
+                )
+
+        for (name, label_set), slots in sorted(hist.items()):
+            lines = by_name.setdefault(name, [])
+            cumulative = 0.0
+            for bound, count in zip(self.buckets, slots):
+                cumulative += count
+                lines.append(
+                    f"{name}_bucket{_format_labels(label_set, ('le', repr(bound)))} "
+                    f"{_format_value(cumulative)}"
+                )
+            cumulative += slots[len(self.buckets)]
+            lines.append(f"{name}_bucket{_format_labels(label_set, ('le', '+Inf'))} {_format_value(cumulative)}")
+            lines.append(f"{name}_sum{_format_labels(label_set)} {slots[-1]!r}")
+            lines.append(f"{name}_count{_format_labels(label_set)} {_format_value(cumulative)}")
+
+        output = []
+        for name, lines in by_name.items():
+            kind, help_text = self._meta.get(name, ("untyped", ""))
+            if help_text:
+                output.append(f"# HELP {name} {help_text}")
+            output.append(f"# TYPE {name} {kind}")
+            output.extend(lines)
+        return "\n".join(output) + "\n"
+
+
+# 애플리케이션 전역 레지스트리
+registry = MetricsRegistry()
+
+registry.describe("http_requests_in_flight", "gauge", "처리 중인 HTTP 요청 수")
+registry.describe("http_requests_total", "counter", "라우트/상태 코드별 HTTP 요청 수")
+registry.describe("http_request_duration_seconds", "histogram", "라우트/상태 코드별 HTTP 요청 지연 시간")
+registry.describe("news_pipeline_stage_duration_seconds", "histogram", "뉴스 파이프라인 단계별 소요 시간")
+registry.describe("news_pipeline_articles_total", "counter", "소스별 수집된 뉴스 기사 수")
+
+
+def time_stage(stage: str, source: Optional[str] = None):
+    """뉴스 파이프라인 단계의 실행 시간을 기록하는 컨텍스트 매니저"""
+    return registry.timer(
+        "news_pipeline_stage_duration_seconds", labels(stage=stage, source=source)
+    )
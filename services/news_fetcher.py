@@ -1,18 +1,21 @@
 """
 뉴스 수집 모듈
 RSS 피드 및 웹 크롤링을 통해 뉴스를 수집합니다.
+
+feedparser, requests, bs4, dateutil 은 import 비용이 크므로
+서버 시작 시가 아니라 처음 뉴스를 수집할 때 함수 안에서 import 합니다.
 """
-import feedparser
-import requests
-from bs4 import BeautifulSoup
 from typing import List, Optional
 from datetime import datetime
 from models import NewsArticle
-import dateutil.parser
+from services.metrics import registry, labels, time_stage
 import urllib.parse
 
 def fetch_rss_news(rss_url: str, source_name: str, limit: int = 5) -> List[NewsArticle]:
     """주어진 RSS URL에서 최신 뉴스를 가져옵니다."""
+    import feedparser
+    import dateutil.parser
+
     try:
         feed = feedparser.parse(rss_url)
         articles = []
@@ -38,6 +41,9 @@ def fetch_rss_news(rss_url: str, source_name: str, limit: int = 5) -> List[NewsA
 
 def fetch_naver_main_hot_news(limit: int = 5) -> List[NewsArticle]:
     """네이버 뉴스 메인에서 Hot 뉴스를 크롤링합니다."""
+    import requests
+    from bs4 import BeautifulSoup
+
     url = "https://news.naver.com/main/main.naver?mode=LSD&mid=shm&sid1=100" # 정치 섹션
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
@@ -100,15 +106,22 @@ def fetch_naver_main_hot_news(limit: int = 5) -> List[NewsArticle]:
         print(f"Error fetching naver main news: {e}")
         return []
 
+def _timed_fetch(source: str, fetch, *args) -> List[NewsArticle]:
+    """소스별 수집 시간과 기사 수를 메트릭으로 기록합니다."""
+    with time_stage("fetch", source=source):
+        articles = fetch(*args)
+    registry.inc("news_pipeline_articles_total", labels(source=source), len(articles))
+    return articles
+
 def fetch_all_news() -> List[NewsArticle]:
     """모든 소스에서 뉴스를 수집합니다."""
     all_articles = []
     
     # RSS 소스
-    all_articles.extend(fetch_rss_news("https://news.sbs.co.kr/news/rss.do?section=01", "SBS 뉴스", 5))
-    all_articles.extend(fetch_rss_news("https://www.yna.co.kr/rss/politics.xml", "연합뉴스", 5))
+    all_articles.extend(_timed_fetch("SBS 뉴스", fetch_rss_news, "https://news.sbs.co.kr/news/rss.do?section=01", "SBS 뉴스", 5))
+    all_articles.extend(_timed_fetch("연합뉴스", fetch_rss_news, "https://www.yna.co.kr/rss/politics.xml", "연합뉴스", 5))
     
     # 네이버 크롤링
-    all_articles.extend(fetch_naver_main_hot_news(10))
+    all_articles.extend(_timed_fetch("네이버 뉴스 메인", fetch_naver_main_hot_news, 10))
     
     return all_articles
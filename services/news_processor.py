@@ -4,33 +4,47 @@
 """
 from typing import List
 from models import NewsArticle
+from services.metrics import time_stage
+from services import trending
 from difflib import SequenceMatcher
 
 def calculate_similarity(a: str, b: str) -> float:
     """두 문자열의 유사도를 계산합니다."""
     return SequenceMatcher(None, a, b).ratio()
 
-def remove_duplicates(articles: List[NewsArticle], threshold: float = 0.8) -> List[NewsArticle]:
+def cluster_articles(articles: List[NewsArticle], threshold: float = 0.8) -> List[List[NewsArticle]]:
     """
-    중복된 뉴스를 제거합니다. 제목 유사도가 threshold 이상인 경우 중복으로 간주합니다.
+    제목 유사도가 threshold 이상인 기사끼리 묶습니다.
+    각 묶음의 첫 번째 기사가 대표 기사입니다.
     """
-    unique_articles = []
-    
+    clusters: List[List[NewsArticle]] = []
+
     for article in articles:
-        is_duplicate = False
-        for unique in unique_articles:
+        for cluster in clusters:
             # 제목 유사도 체크
-            if calculate_similarity(article.title, unique.title) > threshold:
-                is_duplicate = True
-                # 기사가 중복될 경우, 정보를 병합하거나 점수를 높일 수 있음
-                unique.hotness_score = (unique.hotness_score or 0.0) + 5.0
+            if calculate_similarity(article.title, cluster[0].title) > threshold:
+                cluster.append(article)
                 break
-        
-        if not is_duplicate:
-            unique_articles.append(article)
-            
+        else:
+            clusters.append([article])
+
+    return clusters
+
+def merge_clusters(clusters: List[List[NewsArticle]]) -> List[NewsArticle]:
+    """묶음마다 대표 기사만 남기고, 중복 기사 하나당 대표 기사 점수를 5점 올립니다."""
+    unique_articles = []
+    for representative, *duplicates in clusters:
+        if duplicates:
+            representative.hotness_score = (representative.hotness_score or 0.0) + 5.0 * len(duplicates)
+        unique_articles.append(representative)
     return unique_articles
 
+def remove_duplicates(articles: List[NewsArticle], threshold: float = 0.8) -> List[NewsArticle]:
+    """
+    중복된 뉴스를 제거합니다. 제목 유사도가 threshold 이상인 경우 중복으로 간주합니다.
+    """
+    return merge_clusters(cluster_articles(articles, threshold))
+
 def score_articles(articles: List[NewsArticle]) -> List[NewsArticle]:
     """뉴스 기사의 Hot 점수를 계산하고 정렬합니다."""
     for article in articles:
@@ -55,10 +69,18 @@ def score_articles(articles: List[NewsArticle]) -> List[NewsArticle]:
 def get_top_n_news(articles: List[NewsArticle], n: int = 5) -> List[NewsArticle]:
     """중복 제거 및 점수 계산 후 상위 n개의 뉴스를 반환합니다."""
     # 1. 중복 제거
-    unique_articles = remove_duplicates(articles)
+    with time_stage("dedupe"):
+        clusters = cluster_articles(articles)
+        unique_articles = merge_clusters(clusters)
+
+    # 2. 트렌드 기록 (여러 수집 주기에 걸쳐 보도 소스가 늘고 있는 이야기에 가점)
+    with time_stage("trending"):
+        trending.tracker.record(clusters)
+        trending.tracker.boost(unique_articles)
     
-    # 2. 점수 계산 및 정렬
-    scored_articles = score_articles(unique_articles)
+    # 3. 점수 계산 및 정렬
+    with time_stage("score"):
+        scored_articles = score_articles(unique_articles)
     
-    # 3. 상위 N개 추출
+    # 4. 상위 N개 추출
     return scored_articles[:n]
@@ -0,0 +1,224 @@
+"""
+샘플링 프로파일러 모듈
+sys._current_frames()로 살아있는 프로세스의 스택을 주기적으로 수집하고,
+flamegraph.pl / speedscope 에서 읽을 수 있는 collapsed-stack 형식으로 변환합니다.
+"""
+import functools
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+from contextvars import ContextVar
+from datetime import datetime
+from itertools import count
+from typing import Callable, Deque, Dict, List, Optional, Set
+
+# 설정 (기본값은 모두 비활성화)
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")
+SLOW_REQUEST_THRESHOLD_MS = float(os.getenv("SLOW_REQUEST_THRESHOLD_MS", "0"))
+SAMPLE_INTERVAL = float(os.getenv("PROFILE_SAMPLE_INTERVAL_MS", "5")) / 1000.0
+
+# 한 번에 하나의 온디맨드 프로파일만 실행
+_profile_lock = threading.Lock()
+
+# 현재 요청의 SlowRequestCapture 토큰 (스레드풀로 넘어가도 그대로 전달됨)
+_request_token: ContextVar[Optional[int]] = ContextVar("slow_request_token", default=None)
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _collapse(frame, thread_name: str) -> str:
+    parts: List[str] = []
+    while frame is not None:
+        parts.append(_frame_label(frame))
+        frame = frame.f_back
+    parts.append(thread_name)
+    return ";".join(reversed(parts))
+
+
+def _thread_names() -> Dict[int, str]:
+    return {t.ident: t.name for t in threading.enumerate()}
+
+
+def sample_once(exclude_thread: Optional[int] = None) -> Counter:
+    """현재 모든 스레드의 스택을 한 번 수집해 collapsed-stack 카운터로 반환합니다."""
+    names = _thread_names()
+    stacks: Counter = Counter()
+    for thread_id, frame in sys._current_frames().items():
+        if thread_id == exclude_thread:
+            continue
+        stacks[_collapse(frame, names.get(thread_id, f"thread-{thread_id}"))] += 1
+    return stacks
+
+
+def sample_stacks(seconds: float, interval: float = SAMPLE_INTERVAL) -> Counter:
+    """주어진 시간 동안 interval 간격으로 스택을 수집합니다."""
+    me = threading.get_ident()
+    stacks: Counter = Counter()
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        stacks.update(sample_once(exclude_thread=me))
+        time.sleep(interval)
+    return stacks
+
+
+def format_collapsed(stacks: Counter) -> str:
+    """collapsed-stack 형식 (한 줄에 `프레임;프레임;... 샘플수`) 으로 변환합니다."""
+    return "".join(f"{stack} {n}\n" for stack, n in stacks.most_common())
+
+
+def run_profile(seconds: float) -> Optional[str]:
+    """온디맨드 프로파일을 실행합니다. 이미 실행 중이면 None을 반환합니다."""
+    if not _profile_lock.acquire(blocking=False):
+        return None
+    try:
+        return format_collapsed(sample_stacks(seconds))
+    finally:
+        _profile_lock.release()
+
+
+class _ActiveRequest:
+    __slots__ = ("method", "path", "start", "samples", "loop_thread", "worker_threads")
+
+    def __init__(self, method: str, path: str):
+        self.method = method
+        self.path = path
+        self.start = time.perf_counter()
+        self.samples: Counter = Counter()
+        # 미들웨어가 실행되는 이벤트 루프 스레드 (async 핸들러는 여기서 실행됨)
+        self.loop_thread = threading.get_ident()
+        # 동기 핸들러를 실행 중인 스레드풀 워커 스레드
+        self.worker_threads: Set[int] = set()
+
+    def threads(self) -> Set[int]:
+        """이 요청을 처리 중인 스레드 (워커 스레드가 있으면 워커만, 없으면 이벤트 루프)"""
+        return set(self.worker_threads) or {self.loop_thread}
+
+
+class SlowRequestCapture:
+    """
+    임계값보다 오래 걸리는 요청의 프로파일을 자동으로 수집합니다.
+    백그라운드 스레드 하나가 진행 중인 요청을 감시하다가,
+    임계값을 넘긴 요청이 있을 때만 그 요청을 처리 중인 스레드의 스택만 샘플링합니다.
+    """
+
+    def __init__(self, threshold_ms: float, interval: float = SAMPLE_INTERVAL, keep: int = 20):
+        self.threshold = threshold_ms / 1000.0
+        self.interval = interval
+        self.captures: Deque[dict] = deque(maxlen=keep)
+        self._active: Dict[int, _ActiveRequest] = {}
+        self._ids = count(1)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def begin(self, method: str, path: str) -> int:
+        """요청 시작을 등록하고 토큰을 반환합니다."""
+        token = next(self._ids)
+        with self._lock:
+            self._active[token] = _ActiveRequest(method, path)
+        _request_token.set(token)
+        if self._thread is None:
+            self._start()
+        return token
+
+    def attach_thread(self, token: int, thread_id: int) -> None:
+        """동기 핸들러를 실행하는 워커 스레드를 요청에 연결합니다."""
+        with self._lock:
+            active = self._active.get(token)
+            if active is not None:
+                active.worker_threads.add(thread_id)
+
+    def detach_thread(self, token: int, thread_id: int) -> None:
+        with self._lock:
+            active = self._active.get(token)
+            if active is not None:
+                active.worker_threads.discard(thread_id)
+
+    def end(self, token: int) -> None:
+        """요청 종료를 등록합니다. 샘플이 있으면 캡처 목록에 보관합니다."""
+        with self._lock:
+            active = self._active.pop(token, None)
+        if active is None or not active.samples:
+            return
+        self.captures.append({
+            "id": token,
+            "method": active.method,
+            "path": active.path,
+            "duration_ms": round((time.perf_counter() - active.start) * 1000, 1),
+            "captured_at": datetime.now().isoformat(),
+            "samples": sum(active.samples.values()),
+            "profile": format_collapsed(active.samples),
+        })
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="slow-request-profiler", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.interval)
+            now = time.perf_counter()
+            with self._lock:
+                overdue = {
+                    token: request.threads()
+                    for token, request in self._active.items()
+                    if now - request.start >= self.threshold
+                }
+            if not overdue:
+                continue
+
+            frames = sys._current_frames()
+            names = _thread_names()
+            stacks: Dict[int, str] = {}
+            for thread_ids in overdue.values():
+                for thread_id in thread_ids:
+                    if thread_id not in stacks and thread_id in frames:
+                        stacks[thread_id] = _collapse(
+                            frames[thread_id], names.get(thread_id, f"thread-{thread_id}")
+                        )
+            del frames
+
+            # end()에서 pop된 요청에는 기록하지 않도록 락 안에서 다시 확인
+            with self._lock:
+                for token, thread_ids in overdue.items():
+                    request = self._active.get(token)
+                    if request is None:
+                        continue
+                    for thread_id in thread_ids:
+                        if thread_id in stacks:
+                            request.samples[stacks[thread_id]] += 1
+
+
+def track_request_thread(func: Callable) -> Callable:
+    """
+    동기 엔드포인트를 감싸 실행 중인 워커 스레드를 현재 요청에 연결합니다.
+    (미들웨어는 이벤트 루프에서 실행되므로 스레드풀 워커를 직접 알 수 없음)
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        token = _request_token.get()
+        if slow_request_capture is None or token is None:
+            return func(*args, **kwargs)
+        thread_id = threading.get_ident()
+        slow_request_capture.attach_thread(token, thread_id)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            slow_request_capture.detach_thread(token, thread_id)
+
+    return wrapper
+
+
+# 임계값이 설정된 경우에만 생성 (미설정 시 미들웨어도 등록되지 않음)
+slow_request_capture: Optional[SlowRequestCapture] = (
+    SlowRequestCapture(SLOW_REQUEST_THRESHOLD_MS) if SLOW_REQUEST_THRESHOLD_MS > 0 else None
+)
@@ -0,0 +1,123 @@
+"""
+응답 캐시 모듈
+저장소 버전 기반 약한 ETag 생성, If-None-Match 처리 및 직렬화 결과(압축본 포함) 캐싱을 담당합니다.
+"""
+import json
+import secrets
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+from services.compression import COMPRESS_MIN_BYTES, compress, negotiate
+
+
+# 프로세스마다 새로 만드는 부팅 ID
+# 버전 카운터는 재시작(배포, 비정상 종료) 후 같은 숫자를 다시 쓰므로,
+# 이전 프로세스가 발급한 ETag와 겹쳐 잘못된 304가 나가지 않도록 모든 ETag에 포함합니다.
+BOOT_ID = secrets.token_hex(4)
+
+
+def make_etag(*parts: Any) -> str:
+    """부팅 ID와 버전 정보를 조합해 약한(weak) ETag 문자열을 만듭니다."""
+    return 'W/"' + "-".join(str(p) for p in (BOOT_ID, *parts)) + '"'
+
+
+def _strip_weak(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """요청의 If-None-Match 헤더가 현재 ETag와 일치하는지 확인합니다. (약한 비교)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    current = _strip_weak(etag)
+    return any(_strip_weak(tag) == current for tag in header.split(","))
+
+
+class ResponseCache:
+    """(라우트, 쿼리, 버전) 키로 직렬화된 응답 본문을 보관하는 LRU 캐시"""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        with self._lock:
+            body = self._entries.get(key)
+            if body is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def put(self, key: Hashable, body: bytes) -> None:
+        with self._lock:
+            self._entries[key] = body
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# 애플리케이션 전역 캐시
+response_cache = ResponseCache()
+
+
+def render_json(data: Any) -> bytes:
+    """데이터를 JSON 바이트로 직렬화합니다."""
+    return json.dumps(
+        jsonable_encoder(data),
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def cached_json_response(
+    request: Request,
+    route: str,
+    version: Any,
+    etag: str,
+    build: Callable[[], Any],
+) -> Response:
+    """
+    ETag가 일치하면 본문 없이 304를 반환하고,
+    그렇지 않으면 캐시된(또는 새로 직렬화한) JSON 응답을 반환합니다.
+    """
+    headers = {"ETag": etag, "Vary": "Accept-Encoding"}
+    if is_not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    key = (route, str(request.query_params), version)
+    body = response_cache.get(key)
+    if body is None:
+        body = render_json(build())
+        response_cache.put(key, body)
+
+    # 압축본도 같은 버전 키로 캐시하므로 압축 비용은 버전당 인코딩별 한 번만 발생
+    encoding = negotiate(request.headers.get("accept-encoding"))
+    if encoding is not None and len(body) >= COMPRESS_MIN_BYTES:
+        compressed_key = key + (encoding,)
+        compressed = response_cache.get(compressed_key)
+        if compressed is None:
+            compressed = compress(body, encoding)
+            response_cache.put(compressed_key, compressed)
+        body = compressed
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,393 @@
+"""
+검색 인덱스 모듈
+사용자, 작업, 뉴스 기사에 대한 문자 바이그램(2-gram) 역색인을 메모리에 유지합니다.
+
+한국어는 띄어쓰기 단위 토큰이 조사/어미와 붙어 있어 단어 단위 색인으로는 부분 검색이 어렵습니다.
+("배포하기" 에서 "배포" 검색) 그래서 토큰을 두 글자씩 겹쳐 잘라 색인하고,
+검색어의 모든 바이그램을 포함하는 문서만 후보로 삼아 TF-IDF 점수로 정렬합니다.
+
+바이그램마다 포스팅을 영향도 내림차순 리스트로도 유지하므로, 흔한 바이그램이라도
+포스팅 전체를 훑지 않고 앞에서부터 읽다가 상위 limit 개가 확정되면 멈춥니다. (임계값 알고리즘)
+
+인덱스는 라우터(생성/수정/삭제)와 뉴스 파이프라인(수집 결과 교체)이 직접 갱신하므로
+검색할 때 전체 목록을 훑지 않습니다.
+"""
+import heapq
+import math
+import re
+import threading
+import time
+from bisect import bisect_left, insort
+from collections import Counter, OrderedDict
+from operator import itemgetter
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+from database import users_db, tasks_db, news_db, write_lock
+
+# 컬렉션별 색인 필드와 가중치 (제목/이름에서 일치하면 더 높은 점수)
+FIELDS: Dict[str, Tuple[Tuple[str, float], ...]] = {
+    "users": (("name", 2.0), ("email", 1.0)),
+    "tasks": (("title", 2.0), ("description", 1.0)),
+    "news": (("title", 2.0), ("summary", 1.0)),
+}
+
+_TOKEN_RE = re.compile(r"\w+")
+CACHE_SIZE = 256  # 인덱스별 검색 결과 캐시 항목 수
+# 임계값 알고리즘으로 읽을 최대 항목 수 = max(최소값, 가장 짧은 포스팅 길이 / 비율)
+THRESHOLD_SCAN_MIN = 256
+THRESHOLD_SCAN_RATIO = 16
+THRESHOLD_INTERSECT_MAX = 2048  # 교집합이 이 이하면 임계값 탐색 대신 후보 전체 점수 계산
+
+
+def bigrams(text: str) -> List[str]:
+    """
+    텍스트를 소문자 토큰으로 나누고 각 토큰의 문자 바이그램을 반환합니다.
+    한 글자 토큰은 그 글자 자체를 사용합니다.
+    """
+    grams: List[str] = []
+    for token in _TOKEN_RE.findall(text.lower()):
+        if len(token) == 1:
+            grams.append(token)
+        else:
+            grams.extend(token[i:i + 2] for i in range(len(token) - 1))
+    return grams
+
+
+def unigrams(text: str) -> List[str]:
+    """
+    두 글자 이상 토큰의 각 글자를 반환합니다.
+    한 글자 검색어("배")도 "배포하기" 같은 긴 토큰에 일치하도록 글자 단위로도 색인합니다.
+    (한 글자 토큰은 bigrams 가 이미 글자 자체를 반환)
+    """
+    chars: List[str] = []
+    for token in _TOKEN_RE.findall(text.lower()):
+        if len(token) > 1:
+            chars.extend(token)
+    return chars
+
+
+class InvertedIndex:
+    """
+    바이그램(과 글자) -> {문서 키: 영향도} 역색인 (스레드 안전)
+    영향도는 색인 시점에 계산한 (가중 빈도 / 문서 길이 정규화 값)이라 검색 때 다시 계산하지 않습니다.
+    같은 포스팅을 (-영향도, 문서 키) 로 정렬한 리스트도 함께 유지합니다.
+    """
+
+    def __init__(self, fields: Tuple[Tuple[str, float], ...], cache_size: int = CACHE_SIZE):
+        self.fields = fields
+        self.cache_size = cache_size
+        self._lock = threading.Lock()
+        self._postings: Dict[str, Dict[Hashable, float]] = {}
+        self._ranked: Dict[str, List[Tuple[float, Hashable]]] = {}
+        self._doc_grams: Dict[Hashable, Tuple[str, ...]] = {}
+        self._docs: Dict[Hashable, object] = {}
+        # load 중 들어온 변경 (키 -> 문서, 삭제는 None). load 중이 아니면 None
+        self._pending: Optional[Dict[Hashable, object]] = None
+        # 같은 검색어 반복 조회용 결과 캐시 (색인이 바뀌면 비움)
+        self._cache: "OrderedDict[tuple, List[Tuple[float, object]]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def _impacts(self, item) -> Dict[str, float]:
+        weights: Counter = Counter()
+        char_weights: Counter = Counter()
+        for field, weight in self.fields:
+            text = getattr(item, field, None) or ""
+            for gram in bigrams(text):
+                weights[gram] += weight
+            for char in unigrams(text):
+                char_weights[char] += weight
+        # 문서 길이 정규화는 바이그램 기준 (글자 색인을 추가해도 기존 검색 점수는 그대로)
+        norm = math.sqrt(sum(weights.values())) or 1.0
+        weights.update(char_weights)
+        return {gram: weight / norm for gram, weight in weights.items()}
+
+    def _remove_locked(self, key: Hashable) -> None:
+        for gram in self._doc_grams.pop(key, ()):
+            posting = self._postings[gram]
+            ranked = self._ranked[gram]
+            del ranked[bisect_left(ranked, (-posting.pop(key), key))]
+            if not posting:
+                del self._postings[gram]
+                del self._ranked[gram]
+        self._docs.pop(key, None)
+
+    def _add_locked(self, key: Hashable, item, impacts: Dict[str, float]) -> None:
+        self._remove_locked(key)
+        for gram, impact in impacts.items():
+            self._postings.setdefault(gram, {})[key] = impact
+            insort(self._ranked.setdefault(gram, []), (-impact, key))
+        self._doc_grams[key] = tuple(impacts)
+        self._docs[key] = item
+
+    def add(self, key: Hashable, item) -> None:
+        """문서를 색인합니다. 이미 있는 키면 기존 색인을 지우고 다시 색인합니다."""
+        impacts = self._impacts(item)
+        with self._lock:
+            self._add_locked(key, item, impacts)
+            if self._pending is not None:
+                self._pending[key] = item
+            self._cache.clear()
+
+    def begin_load(self) -> None:
+        """
+        load 가 끝날 때까지 들어오는 add/remove 를 기록하기 시작합니다.
+        저장소 행을 복사하는 것과 같은 쓰기 락 안에서 호출하면 그 사이의 변경을 놓치지 않습니다.
+        """
+        with self._lock:
+            self._pending = {}
+
+    def load(self, pairs: Iterable[Tuple[Hashable, object]]) -> None:
+        """
+        기존 색인을 버리고 (키, 문서) 전체를 한 번에 색인합니다. (복원/재구성용)
+        문서마다 insort 하지 않고 바이그램별 리스트를 한 번씩만 정렬합니다.
+        색인을 만드는 동안 들어온 add/remove 는 교체 직후 다시 적용하므로
+        백그라운드 스레드에서 호출해도 됩니다. (그동안 검색은 기존 색인으로 처리)
+        """
+        with self._lock:
+            if self._pending is None:
+                self._pending = {}
+        docs = dict(pairs)
+        postings: Dict[str, Dict[Hashable, float]] = {}
+        doc_grams: Dict[Hashable, Tuple[str, ...]] = {}
+        for key, item in docs.items():
+            impacts = self._impacts(item)
+            for gram, impact in impacts.items():
+                posting = postings.get(gram)
+                if posting is None:
+                    postings[gram] = posting = {}
+                posting[key] = impact
+            doc_grams[key] = tuple(impacts)
+        ranked = {
+            gram: sorted((-impact, key) for key, impact in posting.items())
+            for gram, posting in postings.items()
+        }
+        with self._lock:
+            self._postings = postings
+            self._ranked = ranked
+            self._doc_grams = doc_grams
+            self._docs = docs
+            for key, item in self._pending.items():
+                if item is None:
+                    self._remove_locked(key)
+                else:
+                    self._add_locked(key, item, self._impacts(item))
+            self._pending = None
+            self._cache.clear()
+
+    def remove(self, key: Hashable) -> None:
+        """문서를 색인에서 제거합니다. (없으면 무시)"""
+        with self._lock:
+            if self._pending is not None:
+                self._pending[key] = None
+            if key in self._docs:
+                self._remove_locked(key)
+                self._cache.clear()
+
+    def get(self, key: Hashable):
+        return self._docs.get(key)
+
+    def keys(self) -> List[Hashable]:
+        with self._lock:
+            return list(self._docs)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._postings.clear()
+            self._ranked.clear()
+            self._doc_grams.clear()
+            self._docs.clear()
+            self._cache.clear()
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[float, object]]:
+        """
+        검색어의 모든 바이그램을 포함하는 문서를 (점수, 문서) 목록으로 반환합니다.
+        점수는 바이그램별 IDF x 영향도의 합입니다.
+        """
+        grams = frozenset(bigrams(query))
+        if not grams or limit <= 0:
+            return []
+
+        with self._lock:
+            cache_key = (grams, limit)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+                return cached
+
+            results = self._search_locked(grams, limit)
+            self._cache[cache_key] = results
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            return results
+
+    def _search_locked(self, grams: frozenset, limit: int) -> List[Tuple[float, object]]:
+        terms = []
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if not posting:
+                return []
+            terms.append((posting, self._ranked[gram]))
+        # 가장 짧은 포스팅이 먼저 끝나므로 탐색 깊이의 상한이 됨
+        terms.sort(key=lambda term: len(term[0]))
+
+        total = len(self._docs)
+        idfs = [math.log(1.0 + total / len(posting)) for posting, _ in terms]
+
+        if len(terms) == 1:
+            # 바이그램 하나짜리 검색어는 영향도 순서가 곧 점수 순서
+            return [
+                (round(idfs[0] * -neg_impact, 4), self._docs[key])
+                for neg_impact, key in terms[0][1][:limit]
+            ]
+
+        top = self._threshold_top(terms, idfs, limit)
+        return [(round(score, 4), self._docs[key]) for score, key in top]
+
+    @staticmethod
+    def _threshold_top(terms, idfs, limit: int) -> List[Tuple[float, Hashable]]:
+        """
+        임계값 알고리즘: 모든 리스트를 같은 깊이씩 읽고, 처음 본 문서는 다른 포스팅에서 바로 점수 계산
+        아직 보지 못한 문서의 점수는 현재 깊이의 영향도 합(threshold)을 넘을 수 없으므로
+        상위 limit 개의 최저 점수가 threshold 이상이 되면 멈춥니다.
+        (모든 바이그램을 포함한 문서는 가장 짧은 리스트에 반드시 있으므로 그 리스트가 끝나도 멈춤)
+
+        교집합이 작은 검색어는 리스트를 끝까지 읽어야 하므로, 일정량을 읽은 뒤에는 교집합을 구해
+        THRESHOLD_INTERSECT_MAX 개 이하면 그 후보만 점수를 계산하고 끝냅니다.
+        """
+        heads = [(idf, ranked) for idf, (_, ranked) in zip(idfs, terms)]
+        scorers = [(idf, posting.get) for idf, (posting, _) in zip(idfs, terms)]
+        budget = max(THRESHOLD_SCAN_MIN, len(terms[0][0]) // THRESHOLD_SCAN_RATIO)
+        top: List[Tuple[float, int, Hashable]] = []  # (점수, -발견 순서, 키) 최소 힙
+        seen = set()
+        for depth in range(len(terms[0][1])):
+            if budget is not None and depth * len(heads) > budget:
+                budget = None
+                candidates = terms[0][0].keys()
+                for posting, _ in terms[1:]:
+                    candidates = list(filter(posting.__contains__, candidates))
+                if len(candidates) <= THRESHOLD_INTERSECT_MAX:
+                    scores = dict.fromkeys(candidates, 0.0)
+                    for idf, (posting, _) in zip(idfs, terms):
+                        for key in scores:
+                            scores[key] += idf * posting[key]
+                    top = heapq.nlargest(limit, scores.items(), key=itemgetter(1))
+                    return [(score, key) for key, score in top]
+
+            threshold = 0.0
+            for idf, ranked in heads:
+                neg_impact, key = ranked[depth]
+                threshold -= idf * neg_impact
+                if key in seen:
+                    continue
+                seen.add(key)
+                score = 0.0
+                for term_idf, impact_of in scorers:
+                    impact = impact_of(key)
+                    if impact is None:
+                        break
+                    score += term_idf * impact
+                else:
+                    if len(top) < limit:
+                        heapq.heappush(top, (score, -len(seen), key))
+                    elif score > top[0][0]:
+                        heapq.heapreplace(top, (score, -len(seen), key))
+            if len(top) == limit and top[0][0] >= threshold:
+                break
+
+        top.sort(reverse=True)
+        return [(score, key) for score, _, key in top]
+
+
+# 컬렉션별 인덱스
+indexes: Dict[str, InvertedIndex] = {name: InvertedIndex(fields) for name, fields in FIELDS.items()}
+_rebuild_thread: Optional[threading.Thread] = None
+
+
+# ---------- 라우터 / 파이프라인에서 호출하는 갱신 함수 ----------
+
+def index_user(user) -> None:
+    indexes["users"].add(user.id, user)
+
+
+def index_task(task) -> None:
+    indexes["tasks"].add(task.id, task)
+
+
+def remove_user(user_id: int) -> None:
+    indexes["users"].remove(user_id)
+
+
+def remove_task(task_id: int) -> None:
+    indexes["tasks"].remove(task_id)
+
+
+def index_news(article) -> None:
+    """기사 하나를 URL 기준으로 색인합니다. (요약이 추가된 기사 재색인용)"""
+    indexes["news"].add(article.url, article)
+
+
+def sync_news(articles: Iterable) -> None:
+    """
+    새로 수집한 기사 목록에 맞춰 뉴스 인덱스를 갱신합니다.
+    목록에서 빠진 기사만 제거하고, 새 기사와 바뀐 기사만 다시 색인합니다.
+    """
+    index = indexes["news"]
+    current = {article.url: article for article in articles}
+    for url in set(index.keys()) - current.keys():
+        index.remove(url)
+    for url, article in current.items():
+        if index.get(url) != article:
+            index.add(url, article)
+
+
+def rebuild(background: bool = False) -> None:
+    """
+    저장소 전체로 인덱스를 다시 만듭니다. (스냅샷 복원 후 호출)
+    background=True 면 사용자/작업 인덱스는 백그라운드 스레드에서 만들고 바로 반환합니다.
+    (대용량 스냅샷 복원 시 서버 시작을 막지 않도록. 완료 전까지 검색 결과에서 빠질 수 있음)
+    """
+    global _rebuild_thread
+    # 행 복사와 변경 기록 시작을 쓰기 락 안에서 함께 해야 그 사이의 생성/수정/삭제를 놓치지 않음
+    with write_lock:
+        users = [(user.id, user) for user in users_db]
+        tasks = [(task.id, task) for task in tasks_db]
+        news = [(article.url, article) for article in news_db]
+        indexes["users"].begin_load()
+        indexes["tasks"].begin_load()
+    # 뉴스는 수집 결과 교체(sync_news)가 기존 색인과 비교하므로 항상 바로 만듦 (항목 수도 적음)
+    indexes["news"].load(news)
+
+    if not background:
+        indexes["users"].load(users)
+        indexes["tasks"].load(tasks)
+        return
+
+    def run() -> None:
+        start = time.perf_counter()
+        indexes["users"].load(users)
+        indexes["tasks"].load(tasks)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"🔎 검색 인덱스 재구성 완료 (사용자 {len(users)}, 작업 {len(tasks)}) - {elapsed:.1f}ms")
+
+    _rebuild_thread = threading.Thread(target=run, name="search-index-rebuild", daemon=True)
+    _rebuild_thread.start()
+
+
+def rebuilding() -> bool:
+    """백그라운드 인덱스 재구성이 진행 중인지 여부"""
+    return _rebuild_thread is not None and _rebuild_thread.is_alive()
+
+
+def search(query: str, collections: Iterable[str], limit: int = 10) -> List[Tuple[str, float, object]]:
+    """여러 컬렉션을 검색해 점수 순으로 합친 (컬렉션, 점수, 문서) 목록을 반환합니다."""
+    results = [
+        (name, score, item)
+        for name in collections
+        for score, item in indexes[name].search(query, limit)
+    ]
+    return heapq.nlargest(limit, results, key=lambda row: row[1])
+
+
+rebuild()
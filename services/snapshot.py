@@ -0,0 +1,262 @@
+"""
+스냅샷 모듈
+인메모리 저장소(사용자, 작업, 뉴스)를 바이너리 스냅샷 파일로 저장하고 서버 시작 시 복원합니다.
+
+파일 형식 (리틀 엔디언):
+    MAGIC(8) | 메타 길이(u32) | 메타 JSON
+    섹션마다: 섹션 길이(u32) | 레코드 배열 JSON ([[값, 값, ...], ...])
+    END_MARKER(8)
+
+메타에는 섹션별 필드 이름과 레코드 수가 들어 있고, 레코드는 필드 순서대로 값만 저장합니다.
+(키 이름을 반복 저장하지 않으므로 JSON 객체보다 작습니다)
+쓰기는 임시 파일에 기록 후 os.replace로 교체하므로 중간에 종료되어도 기존 스냅샷이 손상되지 않습니다.
+읽기는 mmap으로 섹션 구간만 잘라 한 번에 파싱합니다.
+섹션마다 저장 당시 모델 스키마의 해시를 함께 기록해 두고, 현재 모델과 같으면(같은 코드가 쓴 스냅샷)
+검증 없이 model_construct 로 만들고, 다르면 TypeAdapter로 리스트 전체를 한 번에 검증합니다.
+(배포로 모델 필드가 바뀌어도 기본값 적용 / 없어진 필드 무시가 그대로 동작)
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from pydantic import TypeAdapter
+
+import database
+from services import search_index, store_index
+from models import User, Task, NewsArticle
+
+# 설정 (SNAPSHOT_PATH를 빈 값으로 두면 비활성화)
+SNAPSHOT_PATH = os.getenv("SNAPSHOT_PATH", "store.snapshot")
+SNAPSHOT_INTERVAL = float(os.getenv("SNAPSHOT_INTERVAL", "60"))  # 초, 0이면 주기 저장 안 함
+
+MAGIC = b"LAPISNP1"
+END_MARKER = b"LAPIEND1"
+_U32 = struct.Struct("<I")
+
+# 섹션 이름 -> (모델, 저장소 리스트)
+SECTIONS: Dict[str, tuple] = {
+    "users": (User, database.users_db),
+    "tasks": (Task, database.tasks_db),
+    "news": (NewsArticle, database.news_db),
+}
+
+_write_lock = threading.Lock()
+
+
+class SnapshotError(Exception):
+    """스냅샷 파일이 손상되었거나 형식이 맞지 않을 때 발생"""
+
+
+@lru_cache(maxsize=None)
+def _adapter(model: type) -> TypeAdapter:
+    return TypeAdapter(List[model])
+
+
+@lru_cache(maxsize=None)
+def _schema_hash(model: type) -> str:
+    """모델 JSON 스키마의 해시 (필드 이름/타입/기본값이 같으면 같은 값)"""
+    schema = json.dumps(model.model_json_schema(), sort_keys=True).encode("utf-8")
+    return hashlib.sha256(schema).hexdigest()[:16]
+
+
+def _construct_rows(model: type, fields: List[str], rows: list) -> list:
+    """
+    검증 없이 모델 목록을 만듭니다. (모든 필드 값이 있는 레코드 전용)
+    model_construct 는 호출마다 필드 별칭/기본값을 확인해 10만 건 기준 1초 가까이 걸리므로,
+    별칭/추가 필드/post_init 이 없는 모델은 model_construct 가 설정하는 속성을 직접 채웁니다.
+    """
+    if (
+        any(field.alias for field in model.model_fields.values())
+        or model.model_config.get("extra") == "allow"
+        or model.__pydantic_root_model__
+        or model.__pydantic_post_init__
+    ):
+        return [model.model_construct(**dict(zip(fields, values))) for values in rows]
+
+    new = model.__new__
+    set_attr = object.__setattr__
+    fields_set = set(fields)
+    items = []
+    for values in rows:
+        item = new(model)
+        set_attr(item, "__dict__", dict(zip(fields, values)))
+        set_attr(item, "__pydantic_fields_set__", set(fields_set))
+        set_attr(item, "__pydantic_extra__", None)
+        set_attr(item, "__pydantic_private__", None)
+        items.append(item)
+    return items
+
+
+def _build_rows(model: type, section: dict, rows: list) -> list:
+    """레코드 배열을 모델 목록으로 변환합니다. 스키마가 같으면 검증을 생략합니다."""
+    fields = section["fields"]
+    if section.get("schema") == _schema_hash(model) and fields == list(model.model_fields):
+        return _construct_rows(model, fields, rows)
+    return _adapter(model).validate_python([dict(zip(fields, values)) for values in rows])
+
+
+def _encode(value) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def save_snapshot(path: str = SNAPSHOT_PATH) -> int:
+    """현재 저장소를 스냅샷으로 저장하고 기록한 바이트 수를 반환합니다."""
+    with _write_lock:
+        # 행과 버전을 같은 쓰기 락 안에서 읽어야 저장된 버전 번호와 데이터가 항상 일치함
+        sections = []
+        captured = []
+        with database.write_lock:
+            versions = dict(database.collection_versions)
+            for name, (model, items) in SECTIONS.items():
+                fields = list(model.model_fields)
+                rows = [[getattr(item, field) for field in fields] for item in items]
+                sections.append({
+                    "name": name, "fields": fields, "count": len(rows), "schema": _schema_hash(model),
+                })
+                captured.append(rows)
+        payloads = [_encode(rows) for rows in captured]
+
+        meta = _encode({
+            "created_at": datetime.now().isoformat(),
+            "versions": versions,
+            "sections": sections,
+        })
+
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(MAGIC)
+            f.write(_U32.pack(len(meta)))
+            f.write(meta)
+            for payload in payloads:
+                f.write(_U32.pack(len(payload)))
+                f.write(payload)
+            f.write(END_MARKER)
+            f.flush()
+            os.fsync(f.fileno())
+            size = f.tell()
+        os.replace(tmp_path, path)
+        return size
+
+
+def load_snapshot(path: str = SNAPSHOT_PATH) -> Optional[dict]:
+    """
+    스냅샷을 읽어 {"sections": {이름: [모델...]}, "versions": {...}, "created_at": ...} 을 반환합니다.
+    파일이 없으면 None, 손상된 경우 SnapshotError를 발생시킵니다.
+    """
+    if not path or not os.path.exists(path):
+        return None
+
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < len(MAGIC) + _U32.size + len(END_MARKER):
+            raise SnapshotError("스냅샷 파일이 너무 작습니다")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm[:len(MAGIC)] != MAGIC or mm[-len(END_MARKER):] != END_MARKER:
+                raise SnapshotError("스냅샷 파일 형식이 올바르지 않습니다 (불완전한 기록)")
+
+            offset = len(MAGIC)
+            (meta_len,) = _U32.unpack_from(mm, offset)
+            offset += _U32.size
+            meta = json.loads(mm[offset:offset + meta_len])
+            offset += meta_len
+
+            sections: Dict[str, list] = {}
+            for section in meta["sections"]:
+                (length,) = _U32.unpack_from(mm, offset)
+                offset += _U32.size
+                model = SECTIONS.get(section["name"], (None,))[0]
+                if model is not None:
+                    rows = json.loads(mm[offset:offset + length])
+                    if len(rows) != section["count"]:
+                        raise SnapshotError(f"{section['name']} 레코드 수가 메타 정보와 맞지 않습니다")
+                    sections[section["name"]] = _build_rows(model, section, rows)
+                offset += length
+
+            if offset != len(mm) - len(END_MARKER):
+                raise SnapshotError("스냅샷 섹션 구성이 메타 정보와 맞지 않습니다")
+
+    return {
+        "created_at": meta.get("created_at"),
+        "versions": meta.get("versions", {}),
+        "sections": sections,
+    }
+
+
+def restore_from_snapshot(path: str = SNAPSHOT_PATH) -> bool:
+    """스냅샷이 있으면 저장소에 복원합니다. 복원했으면 True를 반환합니다."""
+    if not path:
+        return False
+    start = time.perf_counter()
+    try:
+        snapshot = load_snapshot(path)
+    except (SnapshotError, ValueError, struct.error) as e:
+        print(f"⚠️  스냅샷 복원 실패 ({path}): {e}")
+        return False
+    if snapshot is None:
+        return False
+
+    sections = snapshot["sections"]
+    database.restore(
+        users=sections.get("users", []),
+        tasks=sections.get("tasks", []),
+        news=sections.get("news", []),
+        versions=snapshot["versions"],
+    )
+    store_index.rebuild()
+    # 검색 인덱스는 가장 오래 걸리므로 백그라운드에서 만들어 서버 시작(/health 응답)을 막지 않음
+    search_index.rebuild(background=True)
+    elapsed = (time.perf_counter() - start) * 1000
+    counts = ", ".join(f"{name} {len(items)}" for name, items in sections.items())
+    print(f"♻️  스냅샷 복원 ({counts}) - {elapsed:.1f}ms, 생성 시각 {snapshot['created_at']}")
+    return True
+
+
+class SnapshotScheduler:
+    """일정 간격으로 저장소가 바뀌었을 때만 스냅샷을 저장하는 백그라운드 스레드"""
+
+    def __init__(self, path: str = SNAPSHOT_PATH, interval: float = SNAPSHOT_INTERVAL):
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._saved_versions: Optional[Dict[str, int]] = None
+
+    def start(self) -> None:
+        if not self.path or self.interval <= 0 or self._thread is not None:
+            return
+        self._saved_versions = dict(database.collection_versions)
+        self._thread = threading.Thread(target=self._run, name="snapshot-writer", daemon=True)
+        self._thread.start()
+
+    def save_if_changed(self) -> bool:
+        """마지막 저장 이후 저장소 버전이 바뀌었으면 스냅샷을 저장합니다."""
+        versions = dict(database.collection_versions)
+        if versions == self._saved_versions:
+            return False
+        save_snapshot(self.path)
+        self._saved_versions = versions
+        return True
+
+    def stop(self) -> None:
+        """주기 저장을 멈추고 마지막 스냅샷을 저장합니다."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        if self.path:
+            self.save_if_changed()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.save_if_changed()
+            except Exception as e:
+                print(f"⚠️  스냅샷 저장 실패: {e}")
+
+
+snapshot_scheduler = SnapshotScheduler()
@@ -0,0 +1,214 @@
+"""
+저장소 인덱스 모듈
+사용자/작업 컬렉션에 대해 ID 맵과 필드별 정렬 인덱스를 유지합니다.
+
+정렬 인덱스는 (값, ID) 튜플을 정렬된 상태로 보관하는 리스트라서
+정렬된 페이지 조회는 요청마다 전체를 정렬하지 않고 bisect 로 구간을 찾아 잘라내기만 합니다.
+라우터가 생성/수정/삭제 시 직접 갱신합니다. (search_index 와 같은 방식)
+"""
+import threading
+from bisect import bisect_left, bisect_right, insort
+from operator import attrgetter
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from database import users_db, tasks_db
+
+# 컬렉션별 정렬 가능한 필드
+SORT_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "users": ("id", "name", "email", "age"),
+    "tasks": ("id", "title", "completed", "user_id"),
+}
+
+_INF = float("inf")
+
+
+class CollectionIndex:
+    """ID -> 항목 맵과 필드별 (값, ID) 정렬 리스트 (스레드 안전)"""
+
+    def __init__(self, sort_fields: Tuple[str, ...]):
+        self.sort_fields = sort_fields
+        self._lock = threading.Lock()
+        self._by_id: Dict[int, Any] = {}
+        self._sorted: Dict[str, List[Tuple[Any, int]]] = {field: [] for field in sort_fields}
+        # 항목이 제자리에서 수정되므로, 정렬 리스트에서 지우려면 색인 당시의 값을 기억해야 함
+        self._indexed_values: Dict[int, Tuple[Any, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def _remove_locked(self, item_id: int) -> None:
+        values = self._indexed_values.pop(item_id, None)
+        if values is None:
+            return
+        for field, value in zip(self.sort_fields, values):
+            entries = self._sorted[field]
+            del entries[bisect_left(entries, (value, item_id))]
+        del self._by_id[item_id]
+
+    def add(self, item) -> None:
+        """항목을 색인합니다. 이미 있는 ID면 새 값으로 다시 색인합니다."""
+        values = tuple(getattr(item, field) for field in self.sort_fields)
+        with self._lock:
+            self._remove_locked(item.id)
+            for field, value in zip(self.sort_fields, values):
+                insort(self._sorted[field], (value, item.id))
+            self._indexed_values[item.id] = values
+            self._by_id[item.id] = item
+
+    def load(self, items) -> None:
+        """
+        기존 내용을 버리고 항목 전체를 한 번에 색인합니다. (복원/재구성용)
+        항목마다 insort 하지 않고 필드별로 한 번만 정렬합니다.
+        """
+        by_id = {item.id: item for item in items}
+        indexed_values = {
+            item_id: tuple(getattr(item, field) for field in self.sort_fields)
+            for item_id, item in by_id.items()
+        }
+        sorted_entries = {
+            field: sorted((values[i], item_id) for item_id, values in indexed_values.items())
+            for i, field in enumerate(self.sort_fields)
+        }
+        with self._lock:
+            self._by_id = by_id
+            self._indexed_values = indexed_values
+            self._sorted = sorted_entries
+
+    def remove(self, item_id: int) -> None:
+        with self._lock:
+            self._remove_locked(item_id)
+
+    def get(self, item_id: int):
+        return self._by_id.get(item_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._by_id.clear()
+            self._indexed_values.clear()
+            for entries in self._sorted.values():
+                entries.clear()
+
+    def range_ids(
+        self,
+        field: str,
+        low: Optional[Any] = None,
+        high: Optional[Any] = None,
+        descending: bool = False,
+        skip: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[int]:
+        """
+        field 값이 [low, high] 구간에 있는 ID를 정렬 순서대로 반환합니다.
+        limit 을 주면 구간 안에서 skip 이후 limit 개만 잘라내므로 페이지 크기만큼만 복사합니다.
+        (skip / limit 이 음수여도 잘라낸 구간이 [start, end) 밖으로 나가지 않음)
+        """
+        skip = max(skip, 0)
+        if limit is not None:
+            limit = max(limit, 0)
+        with self._lock:
+            entries = self._sorted[field]
+            start = 0 if low is None else bisect_left(entries, (low, -_INF))
+            end = len(entries) if high is None else bisect_right(entries, (high, _INF))
+            if descending:
+                stop = min(max(end - skip, start), end)
+                begin = start if limit is None else min(max(stop - limit, start), stop)
+                window = entries[begin:stop][::-1]
+            else:
+                begin = min(max(start + skip, start), end)
+                stop = end if limit is None else min(max(begin + limit, begin), end)
+                window = entries[begin:stop]
+            return [item_id for _, item_id in window]
+
+    def items(self, ids: List[int]) -> Iterator[Any]:
+        by_id = self._by_id
+        return (by_id[item_id] for item_id in ids if item_id in by_id)
+
+
+# 컬렉션별 인덱스
+indexes: Dict[str, CollectionIndex] = {
+    name: CollectionIndex(fields) for name, fields in SORT_FIELDS.items()
+}
+users = indexes["users"]
+tasks = indexes["tasks"]
+
+
+def parse_sort(collection: str, sort: Optional[str]) -> Optional[Tuple[str, bool]]:
+    """
+    `sort=age` / `sort=-age` 를 (필드, 내림차순 여부)로 변환합니다.
+    지정하지 않으면 None, 정렬할 수 없는 필드면 ValueError 를 발생시킵니다.
+    """
+    if not sort:
+        return None
+    descending = sort.startswith("-")
+    field = sort.lstrip("-+")
+    if field not in SORT_FIELDS[collection]:
+        raise ValueError(
+            f"정렬할 수 없는 필드입니다: {field} (가능: {', '.join(SORT_FIELDS[collection])})"
+        )
+    return field, descending
+
+
+def parse_fields(model: type, fields: Optional[str]) -> Optional[List[str]]:
+    """
+    `fields=id,name` 를 필드 목록으로 변환합니다.
+    지정하지 않으면 None, 모델에 없는 필드가 있으면 ValueError 를 발생시킵니다.
+    """
+    if not fields:
+        return None
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in names if name not in model.model_fields]
+    if unknown:
+        raise ValueError(f"알 수 없는 필드입니다: {', '.join(unknown)}")
+    return names
+
+
+def project(items, fields: Optional[List[str]]) -> list:
+    """fields 가 주어지면 해당 필드만 담은 dict 목록으로 변환합니다."""
+    if fields is None:
+        return list(items)
+    return [{field: getattr(item, field) for field in fields} for item in items]
+
+
+def select(
+    index: CollectionIndex,
+    rows: list,
+    skip: int,
+    limit: int,
+    order: Optional[Tuple[str, bool]] = None,
+    range_field: Optional[str] = None,
+    low: Optional[Any] = None,
+    high: Optional[Any] = None,
+) -> list:
+    """
+    정렬 / 구간 필터를 적용한 한 페이지를 반환합니다.
+    - 정렬, 필터 모두 없음: 저장소 리스트(rows)를 그대로 잘라냄 (삽입 순서)
+    - 정렬만: 정렬 인덱스에서 해당 페이지 구간만 잘라냄
+    - 구간 필터: 필터 필드의 정렬 인덱스로 구간을 찾고, 다른 필드로 정렬하면 그 결과만 정렬
+    """
+    if range_field is None or (low is None and high is None):
+        if order is None:
+            return rows[skip:skip + limit]
+        ids = index.range_ids(order[0], descending=order[1], skip=skip, limit=limit)
+        return list(index.items(ids))
+
+    if order is None or order[0] == range_field:
+        ids = index.range_ids(
+            range_field, low, high, descending=bool(order and order[1]), skip=skip, limit=limit,
+        )
+        return list(index.items(ids))
+
+    field, descending = order
+    matched = sorted(
+        index.items(index.range_ids(range_field, low, high)),
+        key=attrgetter(field), reverse=descending,
+    )
+    return matched[skip:skip + limit]
+
+
+def rebuild() -> None:
+    """저장소 전체로 인덱스를 다시 만듭니다. (스냅샷 복원 후 호출)"""
+    users.load(list(users_db))
+    tasks.load(list(tasks_db))
+
+
+rebuild()
@@ -0,0 +1,212 @@
+"""
+트렌드 감지 모듈
+뉴스 수집 주기마다 중복 제거 단계의 기사 묶음(같은 이야기를 다룬 기사들)을 기록해
+최근 시간 창 동안 보도 소스 수가 빠르게 늘어나는 이야기를 찾아냅니다.
+
+- 이야기마다 시간 버킷 링 버퍼(기본 5분 x 12칸 = 1시간)에 버킷별 보도 소스 수를 기록
+  (같은 버킷 안에서 여러 번 수집해도 최댓값만 남기므로 수집 빈도에 따라 값이 부풀지 않음)
+- 창 안의 합계는 버킷이 밀려날 때마다 빼고 더해 증분으로 유지
+- 속도(velocity) = 현재 버킷 소스 수 - 직전 버킷 소스 수
+- 추적하는 이야기 수는 TRENDING_MAX_STORIES 로 제한하고, 창을 벗어났거나 가장 오래 보이지 않은 이야기부터 제거
+  → 오래 실행해도 메모리 사용량이 일정
+"""
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from models import NewsArticle
+
+# 설정
+TRENDING_WINDOW = int(os.getenv("TRENDING_WINDOW", "3600"))    # 초
+TRENDING_BUCKET = int(os.getenv("TRENDING_BUCKET", "300"))     # 초
+TRENDING_MAX_STORIES = int(os.getenv("TRENDING_MAX_STORIES", "500"))
+TRENDING_WEIGHT = float(os.getenv("TRENDING_WEIGHT", "2.0"))   # Hot 점수에 더할 속도 가중치
+
+MAX_TITLES_PER_STORY = 8  # 다음 수집 때 같은 이야기를 찾기 위해 기억하는 제목 수
+MAX_SOURCES_PER_STORY = 16  # 응답에 보여줄 보도 소스 수
+
+_NON_WORD_RE = re.compile(r"\W+")
+
+
+def normalize_title(title: str) -> str:
+    """공백/문장부호를 제거한 소문자 제목 (수집 주기 간 같은 기사를 찾는 키)"""
+    return _NON_WORD_RE.sub("", title.lower())
+
+
+class Story:
+    """추적 중인 이야기 하나의 버킷 링 버퍼와 누적 값"""
+
+    __slots__ = (
+        "id", "title", "url", "sources", "titles",
+        "counts", "epochs", "total", "first_seen", "last_seen",
+    )
+
+    def __init__(self, story_id: int, article: NewsArticle, num_buckets: int, now: float):
+        self.id = story_id
+        self.title = article.title
+        self.url = article.url
+        self.sources: List[str] = []
+        self.titles: List[str] = []
+        self.counts = [0] * num_buckets
+        self.epochs = [-1] * num_buckets
+        self.total = 0
+        self.first_seen = now
+        self.last_seen = now
+
+    def count_at(self, epoch: int) -> int:
+        slot = epoch % len(self.counts)
+        return self.counts[slot] if self.epochs[slot] == epoch else 0
+
+    def record(self, epoch: int, count: int) -> None:
+        """현재 버킷 값을 갱신하고 창 합계를 증분으로 맞춥니다."""
+        slot = epoch % len(self.counts)
+        if self.epochs[slot] != epoch:
+            # 창을 벗어난 오래된 버킷 값을 합계에서 빼고 재사용
+            self.total -= self.counts[slot]
+            self.counts[slot] = 0
+            self.epochs[slot] = epoch
+        if count > self.counts[slot]:
+            self.total += count - self.counts[slot]
+            self.counts[slot] = count
+
+    def expire(self, epoch: int) -> None:
+        """창을 벗어난 버킷을 합계에서 제거합니다. (조회 시점 기준으로 맞춤)"""
+        oldest = epoch - len(self.counts) + 1
+        for slot, slot_epoch in enumerate(self.epochs):
+            if 0 <= slot_epoch < oldest:
+                self.total -= self.counts[slot]
+                self.counts[slot] = 0
+                self.epochs[slot] = -1
+
+    def velocity(self, epoch: int) -> int:
+        return self.count_at(epoch) - self.count_at(epoch - 1)
+
+
+class TrendingTracker:
+    """수집 주기마다 기사 묶음을 기록하고 빠르게 퍼지는 이야기를 찾는 추적기 (스레드 안전)"""
+
+    def __init__(
+        self,
+        window: int = TRENDING_WINDOW,
+        bucket: int = TRENDING_BUCKET,
+        max_stories: int = TRENDING_MAX_STORIES,
+    ):
+        self.bucket = bucket
+        self.num_buckets = max(2, window // bucket)
+        self.max_stories = max_stories
+        self._lock = threading.Lock()
+        self._next_id = 1
+        # 마지막으로 보인 순서 (가장 오래 보이지 않은 이야기가 앞쪽)
+        self._stories: "OrderedDict[int, Story]" = OrderedDict()
+        self._title_index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._stories)
+
+    def _epoch(self, now: float) -> int:
+        return int(now // self.bucket)
+
+    def _evict(self, story_id: int) -> None:
+        story = self._stories.pop(story_id)
+        for key in story.titles:
+            if self._title_index.get(key) == story_id:
+                del self._title_index[key]
+
+    def _find_or_create(self, cluster: List[NewsArticle], now: float) -> Story:
+        for article in cluster:
+            story_id = self._title_index.get(normalize_title(article.title))
+            if story_id is not None:
+                return self._stories[story_id]
+        story = Story(self._next_id, cluster[0], self.num_buckets, now)
+        self._next_id += 1
+        self._stories[story.id] = story
+        return story
+
+    def record(self, clusters: List[List[NewsArticle]], now: Optional[float] = None) -> None:
+        """
+        한 번의 수집에서 나온 기사 묶음들을 기록합니다.
+        묶음마다 보도한 소스 수를 현재 버킷에 기록합니다.
+        """
+        now = time.time() if now is None else now
+        epoch = self._epoch(now)
+        with self._lock:
+            for cluster in clusters:
+                story = self._find_or_create(cluster, now)
+                story.last_seen = now
+                self._stories.move_to_end(story.id)
+
+                sources = {article.source for article in cluster}
+                for source in sources:
+                    if source not in story.sources and len(story.sources) < MAX_SOURCES_PER_STORY:
+                        story.sources.append(source)
+                story.record(epoch, len(sources))
+
+                for article in cluster:
+                    key = normalize_title(article.title)
+                    if key not in self._title_index and len(story.titles) < MAX_TITLES_PER_STORY:
+                        self._title_index[key] = story.id
+                        story.titles.append(key)
+
+            # 창 밖으로 밀려난 이야기 제거 후 최대 개수 유지
+            cutoff = now - self.num_buckets * self.bucket
+            while self._stories:
+                oldest = next(iter(self._stories.values()))
+                if oldest.last_seen >= cutoff and len(self._stories) <= self.max_stories:
+                    break
+                self._evict(oldest.id)
+
+    def velocity_of(self, article: NewsArticle, now: Optional[float] = None) -> int:
+        """
+        기사가 속한 이야기의 현재 속도를 반환합니다.
+        추적 중이 아니거나 이번 버킷에 처음 등장한 이야기는 0입니다.
+        (한 번의 수집에서 여러 소스가 보도한 것은 중복 제거 가점으로 이미 반영되므로,
+        여러 수집 주기에 걸쳐 보도가 늘어난 경우만 가점 대상)
+        """
+        epoch = self._epoch(time.time() if now is None else now)
+        with self._lock:
+            story_id = self._title_index.get(normalize_title(article.title))
+            if story_id is None:
+                return 0
+            story = self._stories[story_id]
+            if self._epoch(story.first_seen) == epoch:
+                return 0
+            return story.velocity(epoch)
+
+    def boost(self, articles: List[NewsArticle], weight: float = TRENDING_WEIGHT) -> None:
+        """보도 소스가 늘고 있는 이야기의 대표 기사에 Hot 점수를 더합니다."""
+        now = time.time()
+        for article in articles:
+            velocity = self.velocity_of(article, now)
+            if velocity > 0:
+                article.hotness_score = (article.hotness_score or 0.0) + weight * velocity
+
+    def top(self, limit: int = 10, now: Optional[float] = None) -> List[dict]:
+        """속도 -> 현재 버킷 소스 수 -> 창 합계 순으로 트렌드 이야기를 반환합니다."""
+        now = time.time() if now is None else now
+        epoch = self._epoch(now)
+        with self._lock:
+            rows = []
+            for story in self._stories.values():
+                story.expire(epoch)
+                if story.total == 0:
+                    continue
+                rows.append({
+                    "story_id": story.id,
+                    "title": story.title,
+                    "url": story.url,
+                    "sources": list(story.sources),
+                    "current": story.count_at(epoch),
+                    "velocity": story.velocity(epoch),
+                    "mentions": story.total,
+                    "first_seen": datetime.fromtimestamp(story.first_seen).isoformat(),
+                    "last_seen": datetime.fromtimestamp(story.last_seen).isoformat(),
+                })
+        rows.sort(key=lambda r: (r["velocity"], r["current"], r["mentions"]), reverse=True)
+        return rows[:limit]
+
+
+tracker = TrendingTracker()
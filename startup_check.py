@@ -0,0 +1,136 @@
+"""
+서버 시작 시간 점검 도구
+
+역할:
+1. `python -X importtime` 으로 엔트리 모듈 import 비용을 모듈/패키지별로 집계
+2. 전체 import 시간이 예산(--budget-ms)을 넘거나,
+   시작 시 로드되면 안 되는 무거운 모듈(뉴스 수집 의존성)이 로드되면 실패 (exit 1)
+3. --ready 지정 시 프로세스 시작부터 /health 응답까지의 시간도 측정
+
+실행:
+python startup_check.py                              # 기본 점검 (api_server_modular)
+python startup_check.py --budget-ms 800 --repeat 5   # 5회 측정 중 최솟값으로 판정
+ENABLED_ROUTERS=users,tasks,system python startup_check.py --top 20
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+# 서버 시작 시 import 되면 안 되는 모듈 (첫 뉴스 요청 때 로드)
+DEFAULT_FORBIDDEN = ["feedparser", "bs4", "requests", "dateutil"]
+
+# 프로젝트 자체 모듈 (보고서에서 따로 표시)
+PROJECT_PACKAGES = {"api_server", "api_server_modular", "models", "database",
+                    "routers", "services", "middleware"}
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def measure_imports(entry: str) -> List[Tuple[str, int, int]]:
+    """
+    새 인터프리터에서 엔트리 모듈을 import 하고
+    (모듈명, self us, cumulative us) 목록을 반환합니다.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {entry}"],
+        cwd=BASE_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{entry} import 실패:\n{result.stderr[-2000:]}")
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        rows.append((parts[2].strip(), int(parts[0]), int(parts[1])))
+    return rows
+
+
+def summarize(rows: List[Tuple[str, int, int]], entry: str) -> dict:
+    """엔트리 전체 시간과 패키지별 self 시간 합계를 계산합니다."""
+    total_us = next((cum for name, _, cum in rows if name == entry), sum(r[1] for r in rows))
+    by_package: Dict[str, int] = defaultdict(int)
+    for name, self_us, _ in rows:
+        by_package[name.split(".")[0]] += self_us
+    return {
+        "total_ms": total_us / 1000.0,
+        "modules": {name for name, _, _ in rows},
+        "by_package": sorted(by_package.items(), key=lambda kv: kv[1], reverse=True),
+        "project": [(name, cum) for name, _, cum in rows
+                    if name.split(".")[0] in PROJECT_PACKAGES],
+    }
+
+
+def measure_ready(target: str) -> float:
+    """서버 프로세스 시작부터 /health 가 200을 반환할 때까지의 시간(ms)을 측정합니다."""
+    from load_test import start_server
+
+    start = time.perf_counter()
+    process, _ = start_server(target, news_latency_ms=0)
+    elapsed = (time.perf_counter() - start) * 1000.0
+    process.terminate()
+    process.wait(timeout=10)
+    return elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="서버 시작 시간 점검")
+    parser.add_argument("--entry", default="api_server_modular", help="측정할 엔트리 모듈")
+    parser.add_argument("--budget-ms", type=float,
+                        default=float(os.getenv("STARTUP_BUDGET_MS", "1500")),
+                        help="허용되는 최대 import 시간 (ms)")
+    parser.add_argument("--repeat", type=int, default=3, help="측정 반복 횟수 (최솟값 사용)")
+    parser.add_argument("--top", type=int, default=10, help="보고서에 표시할 패키지 수")
+    parser.add_argument("--forbid", action="append",
+                        help="시작 시 로드되면 안 되는 모듈 (기본: 뉴스 수집 의존성)")
+    parser.add_argument("--ready", action="store_true",
+                        help="프로세스 시작부터 /health 응답까지의 시간도 측정")
+    args = parser.parse_args()
+
+    runs = [summarize(measure_imports(args.entry), args.entry) for _ in range(max(1, args.repeat))]
+    best = min(runs, key=lambda r: r["total_ms"])
+
+    print(f"⏱️  {args.entry} import 시간: {best['total_ms']:.1f} ms "
+          f"(최솟값, {len(runs)}회 측정, 예산 {args.budget_ms:.0f} ms)")
+
+    print(f"\n📦 패키지별 self 시간 (상위 {args.top})")
+    for package, self_us in best["by_package"][:args.top]:
+        print(f"  {package:<30} {self_us / 1000.0:>8.1f} ms")
+
+    print("\n🐍 프로젝트 모듈 (cumulative)")
+    for name, cumulative_us in best["project"]:
+        print(f"  {name:<30} {cumulative_us / 1000.0:>8.1f} ms")
+
+    failures = []
+    if best["total_ms"] > args.budget_ms:
+        failures.append(f"import 시간 {best['total_ms']:.1f} ms 가 예산 {args.budget_ms:.0f} ms 초과")
+
+    forbidden = args.forbid if args.forbid is not None else DEFAULT_FORBIDDEN
+    loaded = sorted(m for m in forbidden if m in best["modules"])
+    if loaded:
+        failures.append(f"시작 시 로드되면 안 되는 모듈이 로드됨: {', '.join(loaded)}")
+
+    if args.ready:
+        target = "modular" if args.entry == "api_server_modular" else "monolith"
+        print(f"\n🚀 /health 응답까지: {measure_ready(target):.0f} ms")
+
+    if failures:
+        print("\n❌ 시작 시간 점검 실패")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+
+    print("\n✅ 시작 시간 점검 통과")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
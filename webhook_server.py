@@ -18,8 +18,16 @@ import os
 import sys
 import json
 import subprocess
+import atexit
+import fnmatch
 import hmac
 import hashlib
+import signal
+import threading
+import time
+import urllib.request
+import uuid
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 from flask import Flask, request, jsonify
@@ -36,8 +44,133 @@ REPO_PATH = os.getenv('REPO_PATH', '/Volumes/Elements/project/python/local-api-s
 WEBHOOK_PORT = int(os.getenv('WEBHOOK_PORT', 5000))
 LOG_FILE = os.path.join(REPO_PATH, 'deployment.log')
 PID_FILE = os.path.join(REPO_PATH, 'api_server.pid')
+API_PORT = int(os.getenv('API_PORT', 8000))
+# 배포할 API 서버 진입점 (모듈화 서버만 종료 시 스냅샷 저장 / 시작 시 복원을 지원)
+API_ENTRY = os.getenv('API_ENTRY', 'api_server_modular.py')
+
+# 배포 방식: restart (기존: 종료 후 재시작) | bluegreen (무중단: 새 서버 준비 후 교체)
+DEPLOY_MODE = os.getenv('DEPLOY_MODE', 'restart')
+HEALTH_TIMEOUT = int(os.getenv('HEALTH_TIMEOUT', 30))   # 새 서버 준비 대기 (초)
+DRAIN_TIMEOUT = int(os.getenv('DRAIN_TIMEOUT', 30))     # 기존 서버 요청 마무리 대기 (초)
+
+# 배포 단계 캐시 상태 (마지막으로 성공한 의존성 설치의 requirements.txt 해시, 마지막으로 (재)시작한 커밋 등)
+DEPLOY_STATE_FILE = os.path.join(REPO_PATH, '.deploy_state.json')
+
+# 이 패턴에 해당하는 파일이 바뀐 경우에만 API 서버를 재시작 (문서만 바뀐 push는 재시작 생략)
+SERVER_CODE_PATTERNS = ['*.py', 'requirements.txt']
+
+# 배포 로그 (JSON lines) 회전 설정
+LOG_MAX_BYTES = int(os.getenv('LOG_MAX_BYTES', 5 * 1024 * 1024))
+LOG_BACKUP_COUNT = int(os.getenv('LOG_BACKUP_COUNT', 3))
+LOG_FLUSH_INTERVAL = 1.0  # 초
+
+# 완료된 배포 작업 요약 (한 줄에 작업 하나) - GET /deploys 가 로그 대신 이 파일을 읽음
+# 배포 로그와 같은 방식으로 회전하며 직전 파일(.1) 하나만 남김 → 조회 시 읽는 양이 최대 2배 크기로 제한
+DEPLOY_INDEX_FILE = os.path.join(REPO_PATH, 'deploy_history.jsonl')
+DEPLOY_INDEX_MAX_BYTES = int(os.getenv('DEPLOY_INDEX_MAX_BYTES', 1024 * 1024))
 
 # ========== 로깅 함수 ==========
+class JsonLinesLogWriter:
+    """
+    JSON lines 로그 파일 기록기
+    - 파일을 열어 둔 채 버퍼링하여 기록 (메시지마다 open/close 하지 않음)
+    - WARNING/ERROR 또는 LOG_FLUSH_INTERVAL 경과 시 flush
+    - max_bytes를 넘으면 log → log.1 → log.2 ... 로 회전
+    """
+    
+    def __init__(self, path, max_bytes, backup_count):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._lock = threading.Lock()
+        self._file = None
+        self._size = 0
+        self._last_flush = 0.0
+    
+    def _open(self):
+        self._file = open(self.path, 'ab')
+        self._size = self._file.tell()
+    
+    def _rotate(self):
+        self._file.close()
+        self._file = None
+        for i in range(self.backup_count - 1, 0, -1):
+            src = f'{self.path}.{i}'
+            if os.path.exists(src):
+                os.replace(src, f'{self.path}.{i + 1}')
+        if self.backup_count > 0:
+            os.replace(self.path, f'{self.path}.1')
+        else:
+            os.remove(self.path)
+        self._open()
+    
+    def write(self, record, flush=False):
+        line = (json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8')
+        with self._lock:
+            if self._file is None:
+                self._open()
+            elif self._size + len(line) > self.max_bytes and self._size > 0:
+                self._rotate()
+            self._file.write(line)
+            self._size += len(line)
+            now = time.monotonic()
+            if flush or now - self._last_flush >= LOG_FLUSH_INTERVAL:
+                self._file.flush()
+                self._last_flush = now
+    
+    def flush(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+                self._last_flush = time.monotonic()
+
+def read_lines_reverse(path, block_size=8192):
+    """파일 끝에서부터 거꾸로 한 줄씩 읽기 (파일 전체를 읽지 않음)"""
+    if not os.path.exists(path):
+        return
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        remainder = b''
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            chunk = f.read(read_size) + remainder
+            lines = chunk.split(b'\n')
+            remainder = lines.pop(0)  # 블록 경계에 걸친 줄은 다음 블록과 합침
+            for line in reversed(lines):
+                if line:
+                    yield line.decode('utf-8', errors='replace')
+        if remainder:
+            yield remainder.decode('utf-8', errors='replace')
+
+def format_log_record(line):
+    """JSON 로그 한 줄을 사람이 읽는 형식으로 변환 (이전 텍스트 형식 로그는 그대로)"""
+    try:
+        record = json.loads(line)
+        return f'[{record["ts"]}] [{record["level"]}] {record["msg"]}'
+    except (ValueError, KeyError, TypeError):
+        return line
+
+def tail_log(count=10):
+    """배포 로그의 마지막 count줄"""
+    _log_writer.flush()
+    lines = []
+    for line in read_lines_reverse(LOG_FILE):
+        lines.append(format_log_record(line))
+        if len(lines) >= count:
+            break
+    return list(reversed(lines))
+
+_log_writer = JsonLinesLogWriter(LOG_FILE, LOG_MAX_BYTES, LOG_BACKUP_COUNT)
+atexit.register(_log_writer.flush)
+
+_deploy_index_writer = JsonLinesLogWriter(DEPLOY_INDEX_FILE, DEPLOY_INDEX_MAX_BYTES, 1)
+
+# 배포 워커 스레드에서 기록되는 로그에 작업 ID를 붙이기 위한 컨텍스트
+_log_context = threading.local()
+
 def log_deployment(message, level='INFO'):
     """배포 로그 기록"""
     timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
@@ -46,10 +179,13 @@ def log_deployment(message, level='INFO'):
     # 콘솔 출력
     print(log_message)
     
-    # 파일 기록
+    # 파일 기록 (JSON lines)
+    record = {'ts': timestamp, 'level': level, 'msg': message}
+    job_id = getattr(_log_context, 'job_id', None)
+    if job_id:
+        record['job'] = job_id
     try:
-        with open(LOG_FILE, 'a') as f:
-            f.write(log_message + '\n')
+        _log_writer.write(record, flush=level in ('WARNING', 'ERROR'))
     except Exception as e:
         print(f'로그 기록 실패: {e}')
 
@@ -119,25 +255,38 @@ def kill_api_server():
         log_deployment(f'API 서버 종료 실패: {e}', 'ERROR')
         return False
 
+# 이 webhook 서버가 직접 띄운 API 서버 프로세스 (종료 후 좀비가 남지 않도록 회수용)
+_children = {}
+
+def spawn_api_server():
+    """API 서버 프로세스를 띄우고 Popen 객체를 반환 (실패 시 None)"""
+    # API 서버 진입점이 있는지 확인
+    api_script = os.path.join(REPO_PATH, API_ENTRY)
+    if not os.path.exists(api_script):
+        log_deployment(f'{API_ENTRY}를 찾을 수 없음: {api_script}', 'ERROR')
+        return None
+    
+    # 서버 시작 (백그라운드 실행)
+    # 무중단 교체를 위해 항상 SO_REUSEPORT 소켓으로 실행
+    env = dict(os.environ, API_REUSEPORT='1', API_PORT=str(API_PORT))
+    process = subprocess.Popen(
+        [sys.executable, api_script],
+        cwd=REPO_PATH,
+        env=env,
+        stdout=open(os.path.join(REPO_PATH, 'api_server.log'), 'a'),
+        stderr=subprocess.STDOUT,
+        preexec_fn=os.setpgrp if sys.platform != 'win32' else None
+    )
+    _children[process.pid] = process
+    return process
+
 def start_api_server():
     """API 서버 시작"""
     try:
-        # api_server.py가 있는지 확인
-        api_script = os.path.join(REPO_PATH, 'api_server.py')
-        if not os.path.exists(api_script):
-            log_deployment(f'api_server.py를 찾을 수 없음: {api_script}', 'ERROR')
+        process = spawn_api_server()
+        if process is None:
             return False
         
-        # 서버 시작 (백그라운드 실행)
-        # macOS 방식: nohup 사용
-        process = subprocess.Popen(
-            [sys.executable, api_script],
-            cwd=REPO_PATH,
-            stdout=open(os.path.join(REPO_PATH, 'api_server.log'), 'a'),
-            stderr=subprocess.STDOUT,
-            preexec_fn=os.setpgrp if sys.platform != 'win32' else None
-        )
-        
         save_pid(process.pid)
         log_deployment(f'API 서버 시작 (PID: {process.pid})', 'INFO')
         return True
@@ -145,7 +294,182 @@ def start_api_server():
         log_deployment(f'API 서버 시작 실패: {e}', 'ERROR')
         return False
 
+def is_process_alive(pid):
+    """프로세스가 살아있는지 확인 (직접 띄운 프로세스는 종료 상태도 회수)"""
+    child = _children.get(pid)
+    if child is not None:
+        if child.poll() is None:
+            return True
+        _children.pop(pid, None)
+        return False
+    try:
+        os.kill(pid, 0)
+        return True
+    except OSError:
+        return False
+
+def wait_until_healthy(process, timeout):
+    """
+    새 서버의 /health가 준비될 때까지 대기
+    포트를 기존 서버와 공유하므로 응답의 pid로 새 서버가 응답했는지 확인합니다.
+    """
+    url = f'http://127.0.0.1:{API_PORT}/health'
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            log_deployment(f'새 API 서버가 바로 종료됨 (exit {process.returncode})', 'ERROR')
+            return False
+        try:
+            with urllib.request.urlopen(url, timeout=2) as response:
+                body = json.loads(response.read().decode())
+            if body.get('status') == 'healthy' and body.get('pid') == process.pid:
+                return True
+        except Exception:
+            pass
+        time.sleep(0.2)
+    return False
+
+def drain_api_server(pid, timeout):
+    """
+    기존 서버를 정상 종료 (SIGTERM)
+    uvicorn은 새 연결 수락을 멈추고 처리 중인 요청을 마친 뒤 종료합니다.
+    timeout 안에 끝나지 않을 때만 강제 종료합니다.
+    """
+    try:
+        os.kill(pid, signal.SIGTERM)
+    except OSError:
+        return
+    log_deployment(f'기존 API 서버 드레인 시작 (PID: {pid})', 'INFO')
+    
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if not is_process_alive(pid):
+            log_deployment(f'기존 API 서버 정상 종료 (PID: {pid})', 'INFO')
+            return
+        time.sleep(0.2)
+    
+    log_deployment(f'드레인 타임아웃 ({timeout}초), 강제 종료 (PID: {pid})', 'WARNING')
+    try:
+        os.kill(pid, signal.SIGKILL)
+    except OSError:
+        pass
+    is_process_alive(pid)
+
+def blue_green_restart():
+    """
+    무중단 재시작
+    1. 같은 포트(SO_REUSEPORT)로 새 서버 시작
+    2. 새 서버의 /health가 준비되면 트래픽 전환 (PID 파일 갱신)
+    3. 기존 서버는 처리 중인 요청을 마친 뒤 종료
+    새 서버가 준비되지 않으면 새 서버만 종료하고 기존 서버는 그대로 둡니다.
+    """
+    old_pid = get_api_server_pid()
+    if old_pid and not is_process_alive(old_pid):
+        old_pid = None
+    
+    try:
+        process = spawn_api_server()
+    except Exception as e:
+        log_deployment(f'새 API 서버 시작 실패: {e}', 'ERROR')
+        return False
+    if process is None:
+        return False
+    log_deployment(f'새 API 서버 시작 (PID: {process.pid}), 준비 대기 중...', 'INFO')
+    
+    if not wait_until_healthy(process, HEALTH_TIMEOUT):
+        log_deployment(
+            f'새 API 서버가 {HEALTH_TIMEOUT}초 안에 준비되지 않음, 기존 서버 유지 (PID: {old_pid})\n'
+            f'  (기존 서버가 API_REUSEPORT=1 없이 실행 중이면 포트를 공유할 수 없습니다)',
+            'ERROR'
+        )
+        process.terminate()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        _children.pop(process.pid, None)
+        return False
+    
+    save_pid(process.pid)
+    log_deployment(f'트래픽 전환 완료 → PID {process.pid}', 'INFO')
+    
+    if old_pid and old_pid != process.pid:
+        drain_api_server(old_pid, DRAIN_TIMEOUT)
+    return True
+
+# ========== 배포 단계 캐시 ==========
+def load_deploy_state():
+    """배포 단계 캐시 상태 읽기"""
+    try:
+        with open(DEPLOY_STATE_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_deploy_state(**updates):
+    """배포 단계 캐시 상태 갱신 (임시 파일에 쓴 뒤 교체)"""
+    state = load_deploy_state()
+    state.update(updates)
+    tmp_file = DEPLOY_STATE_FILE + '.tmp'
+    try:
+        with open(tmp_file, 'w') as f:
+            json.dump(state, f)
+        os.replace(tmp_file, DEPLOY_STATE_FILE)
+    except Exception as e:
+        log_deployment(f'배포 상태 저장 실패: {e}', 'WARNING')
+
+def file_sha256(path):
+    """파일 내용의 SHA-256 해시"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
 # ========== Git 작업 ==========
+def git_head():
+    """현재 HEAD 커밋 해시 (실패 시 None)"""
+    try:
+        result = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'],
+            cwd=REPO_PATH,
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+        return result.stdout.strip() if result.returncode == 0 else None
+    except Exception:
+        return None
+
+def changed_files(old_commit, new_commit):
+    """두 커밋 사이에 바뀐 파일 목록 (알 수 없으면 None)"""
+    if not old_commit or not new_commit:
+        return None
+    try:
+        result = subprocess.run(
+            ['git', 'diff', '--name-only', old_commit, new_commit],
+            cwd=REPO_PATH,
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+        if result.returncode != 0:
+            return None
+        return [line for line in result.stdout.splitlines() if line]
+    except Exception:
+        return None
+
+def touches_server_code(files):
+    """바뀐 파일 중 서버 코드가 있는지 (목록을 알 수 없으면 True)"""
+    if files is None:
+        return True
+    return any(
+        fnmatch.fnmatch(path, pattern) or fnmatch.fnmatch(os.path.basename(path), pattern)
+        for path in files
+        for pattern in SERVER_CODE_PATTERNS
+    )
+
 def git_pull():
     """GitHub에서 최신 코드 pull"""
     try:
@@ -183,27 +507,270 @@ def git_pull():
         return False
 
 def check_dependencies():
-    """필요한 Python 패키지 업데이트 (requirements.txt가 있으면)"""
+    """
+    필요한 Python 패키지 업데이트 (requirements.txt가 있으면)
+    requirements.txt 해시가 마지막으로 성공한 설치와 같으면 설치를 건너뜁니다.
+    반환값: 'installed' | 'skipped' | 'failed'
+    """
     try:
         req_file = os.path.join(REPO_PATH, 'requirements.txt')
-        if os.path.exists(req_file):
-            log_deployment('requirements.txt 의존성 설치 중...', 'INFO')
-            result = subprocess.run(
-                [sys.executable, '-m', 'pip', 'install', '-r', req_file],
-                cwd=REPO_PATH,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            if result.returncode == 0:
-                log_deployment('의존성 설치 성공', 'INFO')
-                return True
-            else:
-                log_deployment(f'의존성 설치 실패: {result.stderr}', 'WARNING')
-                return True  # 서버는 계속 시작
+        if not os.path.exists(req_file):
+            return 'skipped'
+        
+        req_hash = file_sha256(req_file)
+        if load_deploy_state().get('requirements_sha256') == req_hash:
+            log_deployment('requirements.txt 변경 없음, 의존성 설치 생략', 'INFO')
+            return 'skipped'
+        
+        log_deployment('requirements.txt 의존성 설치 중...', 'INFO')
+        result = subprocess.run(
+            [sys.executable, '-m', 'pip', 'install', '-r', req_file],
+            cwd=REPO_PATH,
+            capture_output=True,
+            text=True,
+            timeout=60
+        )
+        if result.returncode == 0:
+            save_deploy_state(requirements_sha256=req_hash)
+            log_deployment('의존성 설치 성공', 'INFO')
+            return 'installed'
+        log_deployment(f'의존성 설치 실패: {result.stderr}', 'WARNING')
     except Exception as e:
         log_deployment(f'의존성 확인 오류: {e}', 'WARNING')
-    return True
+    return 'failed'  # 서버는 계속 시작
+
+# ========== 배포 실행 ==========
+class _StepTimer:
+    """배포 단계별 소요 시간을 기록"""
+    
+    def __init__(self, steps, name):
+        self.step = {'name': name, 'status': 'running', 'duration_ms': None}
+        steps.append(self.step)
+    
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self.step
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.step['duration_ms'] = round((time.perf_counter() - self.start) * 1000, 1)
+        if exc_type is not None:
+            self.step['status'] = 'error'
+        elif self.step['status'] == 'running':
+            self.step['status'] = 'ok'
+        log_deployment(f'  ⏱️  {self.step["name"]}: {self.step["duration_ms"]}ms ({self.step["status"]})', 'INFO')
+        return False
+
+def run_deployment(steps=None):
+    """
+    배포 단계 실행 (백그라운드 워커에서 호출)
+    각 단계의 소요 시간과 결과를 steps 목록에 기록합니다.
+    성공 시 None, 실패 시 오류 메시지를 반환합니다.
+    """
+    steps = [] if steps is None else steps
+    
+    log_deployment('=' * 60, 'INFO')
+    log_deployment('자동 배포 시작', 'INFO')
+    log_deployment('=' * 60, 'INFO')
+    
+    # 1단계: Git pull
+    log_deployment('[1/4] Git pull 중...', 'INFO')
+    with _StepTimer(steps, 'git_pull') as step:
+        before = git_head()
+        if not git_pull():
+            step['status'] = 'failed'
+            return 'Git pull failed'
+        after = git_head()
+        pulled = changed_files(before, after)
+        step['changed_files'] = len(pulled) if pulled is not None else None
+        # 재시작 생략 여부는 마지막으로 (재)시작에 성공한 커밋 기준으로 판단
+        # (이전 배포에서 재시작이 실패했거나 생략된 변경도 함께 반영되도록)
+        files = changed_files(load_deploy_state().get('deployed_commit'), after)
+    
+    # 2단계: 의존성 확인
+    log_deployment('[2/4] 의존성 확인 중...', 'INFO')
+    with _StepTimer(steps, 'dependencies') as step:
+        step['status'] = check_dependencies()
+    
+    # 서버 코드가 바뀌지 않았고 서버가 실행 중이면 재시작 생략
+    api_pid = get_api_server_pid()
+    if not touches_server_code(files) and api_pid and is_process_alive(api_pid):
+        log_deployment('[3/4] 서버 코드 변경 없음, API 서버 재시작 생략', 'INFO')
+        steps.append({'name': 'restart', 'status': 'skipped', 'duration_ms': 0.0})
+        log_deployment('=' * 60, 'INFO')
+        log_deployment('자동 배포 완료 ✅ (재시작 없음)', 'INFO')
+        log_deployment('=' * 60, 'INFO')
+        return None
+    
+    with _StepTimer(steps, 'restart') as step:
+        if DEPLOY_MODE == 'bluegreen':
+            # 3-4단계: 새 서버 준비 후 교체 (무중단)
+            log_deployment('[3/4] 새 API 서버 시작 및 준비 확인 중 (무중단)...', 'INFO')
+            if not blue_green_restart():
+                log_deployment('무중단 교체 실패, 기존 서버 유지', 'ERROR')
+                step['status'] = 'failed'
+                return 'New API server failed health check'
+            log_deployment('[4/4] 기존 API 서버 드레인 완료', 'INFO')
+        else:
+            # 3단계: API 서버 종료
+            # 기존 서버가 종료하면서 스냅샷 저장을 마친 뒤에 새 서버가 복원하도록 종료를 기다림
+            log_deployment('[3/4] 기존 API 서버 종료 중...', 'INFO')
+            old_pid = get_api_server_pid()
+            if old_pid and is_process_alive(old_pid):
+                drain_api_server(old_pid, DRAIN_TIMEOUT)
+            else:
+                kill_api_server()
+            
+            # 잠시 대기 (포트 해제 시간)
+            time.sleep(2)
+            
+            # 4단계: API 서버 재시작
+            log_deployment('[4/4] API 서버 재시작 중...', 'INFO')
+            if not start_api_server():
+                log_deployment('API 서버 시작 실패!', 'ERROR')
+                step['status'] = 'failed'
+                return 'Failed to start API server'
+    
+    if after:
+        save_deploy_state(deployed_commit=after)
+    
+    log_deployment('=' * 60, 'INFO')
+    log_deployment('자동 배포 완료 ✅', 'INFO')
+    log_deployment('=' * 60, 'INFO')
+    return None
+
+# ========== 배포 큐 ==========
+# 배포는 단일 백그라운드 워커가 순서대로 실행합니다.
+# 대기 중인 배포가 있을 때 들어온 push는 새 작업을 만들지 않고
+# 대기 중인 작업에 합쳐지므로, 연속 push는 최신 커밋 한 번의 배포로 처리됩니다.
+MAX_DEPLOY_JOBS = 100             # 메모리에 보관할 최근 작업 수
+
+_deploy_jobs = OrderedDict()      # job_id -> 작업 정보 (생성 순서)
+_pending_job_id = None            # 아직 시작되지 않은 작업 (최대 1개)
+_deploy_cond = threading.Condition()
+_deploy_worker = None
+
+def enqueue_deploy(push):
+    """
+    push 정보를 배포 큐에 등록하고 (작업, 합쳐짐 여부)를 반환
+    대기 중인 작업이 있으면 그 작업의 대상 커밋을 최신으로 갱신합니다.
+    """
+    global _pending_job_id
+    with _deploy_cond:
+        pending = _deploy_jobs.get(_pending_job_id) if _pending_job_id else None
+        if pending is not None:
+            pending['commit'] = push['commit']
+            pending['branch'] = push['branch']
+            pending['pushers'].append(push['pusher'])
+            pending['commits'] += push['commits']
+            pending['pushes'] += 1
+            return pending, True
+        
+        job = {
+            'id': uuid.uuid4().hex[:12],
+            'status': 'queued',
+            'repository': push['repository'],
+            'branch': push['branch'],
+            'commit': push['commit'],
+            'pushers': [push['pusher']],
+            'commits': push['commits'],
+            'pushes': 1,
+            'created_at': datetime.now().isoformat(),
+            'started_at': None,
+            'finished_at': None,
+            'error': None,
+            'steps': [],
+        }
+        _deploy_jobs[job['id']] = job
+        while len(_deploy_jobs) > MAX_DEPLOY_JOBS:
+            _deploy_jobs.popitem(last=False)
+        _pending_job_id = job['id']
+        _ensure_deploy_worker()
+        _deploy_cond.notify()
+        return job, False
+
+def get_deploy_job(job_id):
+    """배포 작업 정보 조회 (없으면 None)"""
+    with _deploy_cond:
+        job = _deploy_jobs.get(job_id)
+        if job is None:
+            return None
+        return dict(job, pushers=list(job['pushers']), steps=[dict(step) for step in job['steps']])
+
+def append_deploy_history(job):
+    """완료된 배포 작업 요약을 인덱스 파일에 추가 (DEPLOY_INDEX_MAX_BYTES 초과 시 회전)"""
+    try:
+        _deploy_index_writer.write(job, flush=True)
+    except Exception as e:
+        log_deployment(f'배포 이력 기록 실패: {e}', 'WARNING')
+
+def _deploy_history_lines():
+    """인덱스 파일과 회전된 직전 파일을 최신순으로 읽기"""
+    yield from read_lines_reverse(DEPLOY_INDEX_FILE)
+    yield from read_lines_reverse(f'{DEPLOY_INDEX_FILE}.1')
+
+def read_deploy_history(offset=0, limit=20):
+    """최신순으로 offset부터 limit개의 완료된 배포 작업 (인덱스 파일 끝에서부터 읽음)"""
+    jobs = []
+    for i, line in enumerate(_deploy_history_lines()):
+        if i < offset:
+            continue
+        if len(jobs) >= limit:
+            break
+        try:
+            jobs.append(json.loads(line))
+        except ValueError:
+            continue
+    return jobs
+
+def find_deploy_history(job_id):
+    """인덱스 파일에서 배포 작업 찾기 (webhook 서버 재시작 후 조회용, 회전으로 남은 범위만 검색)"""
+    for line in _deploy_history_lines():
+        if job_id not in line:
+            continue
+        try:
+            job = json.loads(line)
+        except ValueError:
+            continue
+        if job.get('id') == job_id:
+            return job
+    return None
+
+def _ensure_deploy_worker():
+    """배포 워커 스레드 시작 (_deploy_cond를 잡은 상태에서 호출)"""
+    global _deploy_worker
+    if _deploy_worker is None or not _deploy_worker.is_alive():
+        _deploy_worker = threading.Thread(target=_deploy_loop, name='deploy-worker', daemon=True)
+        _deploy_worker.start()
+
+def _deploy_loop():
+    """대기 중인 작업을 하나씩 꺼내 배포를 실행"""
+    global _pending_job_id
+    while True:
+        with _deploy_cond:
+            while _pending_job_id is None:
+                _deploy_cond.wait()
+            job = _deploy_jobs[_pending_job_id]
+            _pending_job_id = None  # 이후 push는 새 작업으로 대기
+            job['status'] = 'running'
+            job['started_at'] = datetime.now().isoformat()
+        
+        _log_context.job_id = job['id']
+        log_deployment(f'배포 작업 시작: {job["id"]} (커밋 {job["commit"]}, push {job["pushes"]}건)', 'INFO')
+        try:
+            error = run_deployment(job['steps'])
+        except Exception as e:
+            error = str(e)
+            log_deployment(f'배포 중 오류 발생: {e}', 'ERROR')
+        
+        with _deploy_cond:
+            job['status'] = 'failed' if error else 'succeeded'
+            job['error'] = error
+            job['finished_at'] = datetime.now().isoformat()
+            summary = dict(job, pushers=list(job['pushers']), steps=[dict(step) for step in job['steps']])
+        log_deployment(f'배포 작업 종료: {job["id"]} ({job["status"]})', 'INFO')
+        _log_context.job_id = None
+        append_deploy_history(summary)
+        _log_writer.flush()
 
 # ========== Webhook 엔드포인트 ==========
 @app.route('/webhook/github', methods=['POST'])
@@ -218,6 +785,9 @@ def github_webhook():
     4. Content type: application/json
     5. Secret: (GITHUB_WEBHOOK_SECRET와 동일)
     6. Events: Push events 선택
+    
+    배포는 백그라운드에서 실행되며, 즉시 202와 배포 작업 ID를 반환합니다.
+    진행 상황은 GET /deploys/<job_id> 로 확인합니다.
     """
     
     # GitHub 서명 검증
@@ -241,63 +811,77 @@ def github_webhook():
         return jsonify({'status': 'Event ignored (not a push)'}), 200
     
     # 푸시 정보 추출
-    repository = payload.get('repository', {}).get('name', 'unknown')
-    branch = payload.get('ref', '').split('/')[-1]
-    pusher = payload.get('pusher', {}).get('name', 'unknown')
-    commit_count = len(payload.get('commits', []))
+    push = {
+        'repository': payload.get('repository', {}).get('name', 'unknown'),
+        'branch': payload.get('ref', '').split('/')[-1],
+        'pusher': payload.get('pusher', {}).get('name', 'unknown'),
+        'commit': payload.get('after', ''),
+        'commits': len(payload.get('commits', [])),
+    }
     
     log_deployment(
         f'GitHub Push 감지\n'
-        f'  리포지토리: {repository}\n'
-        f'  브랜치: {branch}\n'
-        f'  푸셔: {pusher}\n'
-        f'  커밋: {commit_count}개',
+        f'  리포지토리: {push["repository"]}\n'
+        f'  브랜치: {push["branch"]}\n'
+        f'  푸셔: {push["pusher"]}\n'
+        f'  커밋: {push["commits"]}개',
         'INFO'
     )
     
-    # ========== 자동 배포 프로세스 ==========
-    log_deployment('=' * 60, 'INFO')
-    log_deployment('자동 배포 시작', 'INFO')
-    log_deployment('=' * 60, 'INFO')
+    job, coalesced = enqueue_deploy(push)
+    if coalesced:
+        log_deployment(f'대기 중인 배포 작업 {job["id"]}에 합쳐짐 (push {job["pushes"]}건)', 'INFO')
+    else:
+        log_deployment(f'배포 작업 등록: {job["id"]}', 'INFO')
     
+    return jsonify({
+        'status': 'Deployment queued',
+        'job_id': job['id'],
+        'coalesced': coalesced,
+        'status_url': f'/deploys/{job["id"]}',
+        'repository': push['repository'],
+        'branch': push['branch'],
+        'commits': push['commits']
+    }), 202
+
+@app.route('/deploys/<job_id>', methods=['GET'])
+def deploy_status(job_id):
+    """배포 작업 상태 조회 (queued → running → succeeded / failed)"""
+    job = get_deploy_job(job_id) or find_deploy_history(job_id)
+    if job is None:
+        return jsonify({'error': 'Deploy job not found'}), 404
+    return jsonify(job), 200
+
+@app.route('/deploys', methods=['GET'])
+def deploy_history():
+    """
+    배포 이력 조회 (최신순)
+    - page: 페이지 번호 (1부터)
+    - per_page: 페이지당 작업 수 (최대 100)
+    진행 중이거나 대기 중인 작업은 active 에 따로 표시됩니다.
+    """
     try:
-        # 1단계: Git pull
-        log_deployment('[1/4] Git pull 중...', 'INFO')
-        if not git_pull():
-            return jsonify({'error': 'Git pull failed'}), 500
-        
-        # 2단계: 의존성 확인
-        log_deployment('[2/4] 의존성 확인 중...', 'INFO')
-        check_dependencies()
-        
-        # 3단계: API 서버 종료
-        log_deployment('[3/4] 기존 API 서버 종료 중...', 'INFO')
-        kill_api_server()
-        
-        # 잠시 대기 (포트 해제 시간)
-        import time
-        time.sleep(2)
-        
-        # 4단계: API 서버 재시작
-        log_deployment('[4/4] API 서버 재시작 중...', 'INFO')
-        if not start_api_server():
-            log_deployment('API 서버 시작 실패!', 'ERROR')
-            return jsonify({'error': 'Failed to start API server'}), 500
-        
-        log_deployment('=' * 60, 'INFO')
-        log_deployment('자동 배포 완료 ✅', 'INFO')
-        log_deployment('=' * 60, 'INFO')
-        
-        return jsonify({
-            'status': 'Deployment successful',
-            'repository': repository,
-            'branch': branch,
-            'commits': commit_count
-        }), 200
-        
-    except Exception as e:
-        log_deployment(f'배포 중 오류 발생: {e}', 'ERROR')
-        return jsonify({'error': str(e)}), 500
+        page = max(1, int(request.args.get('page', 1)))
+        per_page = min(100, max(1, int(request.args.get('per_page', 20))))
+    except ValueError:
+        return jsonify({'error': 'page/per_page must be integers'}), 400
+    
+    with _deploy_cond:
+        active = [
+            dict(job, pushers=list(job['pushers']), steps=[dict(step) for step in job['steps']])
+            for job in _deploy_jobs.values()
+            if job['status'] in ('queued', 'running')
+        ]
+    
+    # 다음 페이지 존재 여부 확인을 위해 하나 더 읽음
+    jobs = read_deploy_history(offset=(page - 1) * per_page, limit=per_page + 1)
+    return jsonify({
+        'page': page,
+        'per_page': per_page,
+        'has_next': len(jobs) > per_page,
+        'active': active,
+        'deploys': jobs[:per_page]
+    }), 200
 
 # ========== 상태 확인 엔드포인트 ==========
 @app.route('/status', methods=['GET'])
@@ -309,25 +893,20 @@ def status():
         api_pid = get_api_server_pid()
         
         if api_pid:
-            try:
-                os.kill(api_pid, 0)  # 프로세스 존재 확인
-                api_running = True
-            except OSError:
-                pass
+            api_running = is_process_alive(api_pid)  # 프로세스 존재 확인
         
-        # 최근 로그 읽기
-        recent_logs = []
-        if os.path.exists(LOG_FILE):
-            with open(LOG_FILE, 'r') as f:
-                recent_logs = f.readlines()[-10:]  # 최근 10줄
+        # 최근 로그 읽기 (파일 끝에서부터 10줄만)
+        recent_logs = tail_log(10)
         
         return jsonify({
             'webhook_server': 'running',
             'webhook_port': WEBHOOK_PORT,
             'api_server': 'running' if api_running else 'stopped',
             'api_pid': api_pid,
+            'deploy_mode': DEPLOY_MODE,
+            'pending_deploy': _pending_job_id,
             'repo_path': REPO_PATH,
-            'recent_logs': [log.strip() for log in recent_logs]
+            'recent_logs': recent_logs
         }), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 500